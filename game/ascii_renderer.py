@@ -3,186 +3,434 @@ ASCII-style retro renderer for the dungeon crawler
 """
 
 import pygame
-from typing import Tuple, Dict
+from collections import OrderedDict
+from typing import Tuple, Dict, List
 from .constants import *
-from .hex_grid import HexGrid
+from .hex_grid import HEX_SCREEN_VERTEX_OFFSETS
+from .enemy import format_combat_log_entry
 
-class ASCIIRenderer:
-    """Handles ASCII-style rendering with retro aesthetics"""
+def _to_display_format(surface: pygame.Surface, alpha: bool = False) -> pygame.Surface:
+    """Convert a cached surface to the display pixel format for fast blits"""
+    if pygame.display.get_surface() is None:
+        return surface  # No display yet (headless tools, tests)
+    return surface.convert_alpha() if alpha else surface.convert()
+
+class MapRenderer:
+    """Per-frame map drawing: tiles, entities and the cached map layer"""
     
-    def __init__(self):
-        # Initialize fonts
-        self.tile_font = pygame.font.Font(None, 48)  # Large font for tiles
-        self.ui_font = pygame.font.Font(None, 32)    # Medium font for UI
-        self.small_font = pygame.font.Font(None, 24) # Small font for details
-        
-        # ASCII symbols for different elements
-        self.symbols = {
-            TILE_FLOOR: ".",
-            TILE_WALL: "#",
-            TILE_STAIRS_DOWN: ">",
-            TILE_STAIRS_UP: "<",
-            TILE_GOLD: "$",
-            "player": "@",
-            "goblin": "g",
-            "orc": "o", 
-            "skeleton": "s",
-            "troll": "T",
-            "unknown": " ",
-            "explored_empty": "·"  # Dimmed floor
+    __slots__ = (
+        "tile_font", "symbols", "colors",
+        "_bg_visible", "_anticipation_colors", "_symbols_by_tile", "_colors_by_tile",
+        "_fog_table", "_entity_effect_colors", "_glyph_cache", "_hex_bg_cache", "_tile_table",
+        "_hex_anchor", "_hex_stamp_size", "_hex_local_vertices", "_entity_bg_surface",
+        "_map_layer", "_map_layer_bounds", "_map_layer_origin", "_last_tile_state",
+    )
+    
+    # Upper bound for the glyph cache (effect colors are unbounded)
+    GLYPH_CACHE_SIZE = 1024
+    
+    # Effect flag bits for render_entity_with_effects
+    EFFECT_ANTICIPATION = 1
+    EFFECT_HIT_FLASH = 2
+    EFFECT_CRITICAL = 4
+    
+    # Hex vertex offsets as HexGrid.get_hex_vertices produces them on screen
+    _hex_offsets = HEX_SCREEN_VERTEX_OFFSETS
+    
+    def __init__(self, tile_font: pygame.font.Font, symbols: dict, colors: dict):
+        self.tile_font = tile_font
+        self.symbols = symbols
+        self.colors = colors
+        
+        # Pre-computed color variants
+        self._bg_visible = tuple(min(255, c + 10) for c in self.colors["background"])
+        self._anticipation_colors = {
+            key: tuple(min(255, int(c * 1.2)) for c in color)
+            for key, color in self.colors.items()
         }
-        
-        # Color scheme - retro terminal colors
-        self.colors = {
-            TILE_FLOOR: (100, 100, 100),      # Dark gray
-            TILE_WALL: (200, 200, 200),       # Light gray
-            TILE_STAIRS_DOWN: (100, 150, 255), # Light blue
-            TILE_STAIRS_UP: (100, 255, 100),   # Light green
-            TILE_GOLD: (255, 215, 0),          # Gold
-            "player": (255, 255, 255),         # White
-            "goblin": (255, 100, 100),         # Light red
-            "orc": (200, 50, 50),              # Dark red
-            "skeleton": (220, 220, 220),       # Off-white
-            "troll": (139, 69, 19),            # Brown
-            "background": (20, 20, 30),        # Dark blue-black
-            "ui_text": (200, 200, 200),        # Light gray
-            "ui_accent": (100, 200, 255),      # Cyan
-            "explored": (60, 60, 60),          # Very dark gray
-            "preview": (80, 80, 100),          # Dark blue-gray
-            "error": (255, 100, 100),          # Red for errors
-            "success": (100, 255, 150),        # Green for success
-            "warning": (255, 200, 100),        # Yellow for warnings
-            "ui_panel": (25, 25, 35),          # Dark panel background
-            "gold": (255, 215, 0),             # Gold color for gold messages
-            "damage_dealt": (255, 150, 100),   # Orange for damage dealt
-            "damage_received": (255, 100, 100), # Red for damage received
-            "heal": (100, 255, 100),           # Green for healing
+        # Tile ids are a small dense range, so per-tile lookups are list indexes
+        self._symbols_by_tile = [self.symbols.get(i, "?") for i in range(MAX_TILE_ID + 1)]
+        self._colors_by_tile = [self.colors.get(i, WHITE) for i in range(MAX_TILE_ID + 1)]
+        
+        # fog_state -> (color override, background, floor symbol override)
+        self._fog_table = {
+            "visible": (None, self._bg_visible, None),
+            "explored": (self.colors["explored"], self.colors["background"], self.symbols["explored_empty"]),
+            "preview": (self.colors["preview"], self.colors["background"], None),
+            "unknown": None,
+        }
+        self._entity_effect_colors = {
+            (entity_type, flags): self._effect_color(entity_type, flags)
+            for entity_type in self.symbols if isinstance(entity_type, str)
+            for flags in range(8)
         }
+        
+        # Rendered surface caches so glyphs aren't re-rasterized every frame
+        self._glyph_cache: Dict[Tuple, pygame.Surface] = {}
+        self._prerender_glyphs()
+        
+        # Pre-baked hex backgrounds (fill + outline) keyed by (fog_state, tile_type)
+        self._hex_bg_cache: Dict[Tuple, pygame.Surface] = {}
+        # fog_state -> draw entries indexed by tile id, so the tile loop is two indexes
+        self._tile_table: Dict[str, List] = {}
+        self._prerender_hex_backgrounds()
+        
+        # Persistent world-space map layer; only tiles whose (tile_type, fog_state)
+        # changed get redrawn into it
+        self._map_layer = None
+        self._map_layer_bounds = (0, 0, -1, -1)
+        self._map_layer_origin = (0, 0)
+        self._last_tile_state: Dict[Tuple[int, int], Tuple] = {}
     
-    def render_tile(self, screen: pygame.Surface, x: int, y: int, tile_type: int, 
-                   fog_state: str = "visible"):
-        """Render a single tile with ASCII symbol"""
-        symbol = self.symbols.get(tile_type, "?")
-        
-        # Determine color based on fog state
-        if fog_state == "visible":
-            color = self.colors.get(tile_type, WHITE)
-        elif fog_state == "explored":
-            color = self.colors["explored"]
-            if tile_type == TILE_FLOOR:
-                symbol = self.symbols["explored_empty"]
-        elif fog_state == "preview":
-            color = self.colors["preview"]
-        else:  # unknown
-            return  # Don't render unknown tiles
-        
-        # Render background hex
-        vertices = HexGrid.get_hex_vertices(x, y)
-        bg_color = self.colors["background"]
-        if fog_state == "visible":
-            bg_color = tuple(min(255, c + 10) for c in bg_color)  # Slightly lighter
-        
-        pygame.draw.polygon(screen, bg_color, vertices)
-        pygame.draw.polygon(screen, color, vertices, 1)
-        
-        # Render ASCII symbol
-        text_surface = self.tile_font.render(symbol, True, color)
-        text_rect = text_surface.get_rect(center=(x, y))
-        screen.blit(text_surface, text_rect)
+    def _prerender_glyphs(self):
+        """Pre-render every symbol in the colors it is drawn with"""
+        fog_colors = (self.colors["explored"], self.colors["preview"])
+        for key, symbol in self.symbols.items():
+            self._get_glyph(self.tile_font, symbol, self.colors.get(key, WHITE))
+            for color in fog_colors:
+                self._get_glyph(self.tile_font, symbol, color)
+    
+    def _prerender_hex_backgrounds(self):
+        """Rasterize the hex polygon once for every tile/fog combination"""
+        offsets = self._hex_offsets
+        self._hex_anchor = (-min(dx for dx, _ in offsets), -min(dy for _, dy in offsets))
+        self._hex_stamp_size = (max(dx for dx, _ in offsets) + self._hex_anchor[0] + 1,
+                                max(dy for _, dy in offsets) + self._hex_anchor[1] + 1)
+        self._hex_local_vertices = [(self._hex_anchor[0] + dx, self._hex_anchor[1] + dy)
+                                    for dx, dy in offsets]
+        
+        # Translucent backdrop drawn behind entity glyphs
+        entity_bg = pygame.Surface(self._hex_stamp_size, pygame.SRCALPHA)
+        pygame.draw.polygon(entity_bg, (0, 0, 0, 100), self._hex_local_vertices)
+        self._entity_bg_surface = _to_display_format(entity_bg, alpha=True)
+        
+        for fog_state in ("visible", "explored", "preview"):
+            self._tile_table[fog_state] = [self._build_tile_entry(tile_type, fog_state)
+                                           for tile_type in range(MAX_TILE_ID + 1)]
+    
+    def _build_tile_entry(self, tile_type: int, fog_state: str):
+        """Resolve the (hex stamp, glyph, glyph dx, glyph dy) used to draw a tile"""
+        entry = self._fog_table.get(fog_state)
+        if entry is None:
+            return None  # Don't render unknown tiles
+        
+        color_override, bg_color, symbol_override = entry
+        if 0 <= tile_type <= MAX_TILE_ID:
+            color = color_override or self._colors_by_tile[tile_type]
+            symbol = self._symbols_by_tile[tile_type]
+        else:
+            color = color_override or self.colors.get(tile_type, WHITE)
+            symbol = self.symbols.get(tile_type, "?")
+        if symbol_override and tile_type == TILE_FLOOR:
+            symbol = symbol_override
+        
+        hex_surface = self._hex_bg_cache.get((fog_state, tile_type))
+        if hex_surface is None:
+            hex_surface = pygame.Surface(self._hex_stamp_size, pygame.SRCALPHA)
+            pygame.draw.polygon(hex_surface, bg_color, self._hex_local_vertices)
+            pygame.draw.polygon(hex_surface, color, self._hex_local_vertices, 1)
+            hex_surface = _to_display_format(hex_surface, alpha=True)
+            self._hex_bg_cache[(fog_state, tile_type)] = hex_surface
+        
+        glyph = self._get_glyph(self.tile_font, symbol, color)
+        width, height = glyph.get_size()
+        return hex_surface, glyph, width // 2, height // 2
+    
+    def _get_glyph(self, font: pygame.font.Font, symbol: str, color) -> pygame.Surface:
+        """Get a cached rendered glyph, rendering it on first use"""
+        key = (id(font), symbol, color)
+        surface = self._glyph_cache.get(key)
+        if surface is None:
+            if len(self._glyph_cache) >= self.GLYPH_CACHE_SIZE:
+                # Effect colors are unbounded, drop the oldest entry
+                del self._glyph_cache[next(iter(self._glyph_cache))]
+            surface = _to_display_format(font.render(symbol, True, color), alpha=True)
+            self._glyph_cache[key] = surface
+        return surface
+    
+    def render_tile(self, screen: pygame.Surface, x: int, y: int, tile_type: int, fog_state: str = "visible"):
+        """Render a single hex tile with ASCII symbol"""
+        self.render_tiles(screen, ((x, y, tile_type, fog_state),))
+    
+    def render_tiles(self, screen: pygame.Surface, tiles):
+        """Render a batch of (x, y, tile_type, fog_state) hex tiles
+        
+        Hex backgrounds come from pre-baked surfaces and go out together with
+        the glyphs in a single blits call instead of per-tile draw calls.
+        """
+        hex_blits = []
+        glyph_blits = []
+        anchor_x, anchor_y = self._hex_anchor
+        table = self._tile_table
+        
+        # Cull tiles whose hex can't touch the clip rect
+        clip = screen.get_clip()
+        min_x, max_x = clip.left - HEX_WIDTH, clip.right + HEX_WIDTH
+        min_y, max_y = clip.top - HEX_HEIGHT, clip.bottom + HEX_HEIGHT
+        
+        for x, y, tile_type, fog_state in tiles:
+            if x < min_x or x > max_x or y < min_y or y > max_y:
+                continue
+            
+            entries = table.get(fog_state)
+            if entries is None:
+                continue  # Don't render unknown tiles
+            if 0 <= tile_type <= MAX_TILE_ID:
+                entry = entries[tile_type]
+            else:
+                entry = self._build_tile_entry(tile_type, fog_state)
+            
+            hex_surface, glyph, glyph_dx, glyph_dy = entry
+            hex_blits.append((hex_surface, (x - anchor_x, y - anchor_y)))
+            glyph_blits.append((glyph, (x - glyph_dx, y - glyph_dy)))
+        
+        blit_list = hex_blits + glyph_blits
+        if blit_list:
+            fblits = getattr(screen, "fblits", None)  # pygame-ce only
+            if fblits:
+                fblits(blit_list)
+            else:
+                screen.blits(blit_list, doreturn=False)
+    
+    def render_map(self, screen: pygame.Surface, tiles, offset: Tuple[float, float]):
+        """Render world-space (x, y, tile_type, fog_state) map tiles through the map layer
+        
+        Tiles are baked into a world-space layer that is blitted translated by
+        the camera offset, so panning costs a single blit. Only tiles whose
+        signature changed since last frame are redrawn; the layer is rebuilt
+        when a tile falls outside it or a previously drawn tile is gone.
+        """
+        tiles = list(tiles)
+        last_state = self._last_tile_state
+        rebuild = self._map_layer is None
+        left, top, right, bottom = self._map_layer_bounds
+        
+        dirty = []
+        for tile in tiles:
+            x, y, tile_type, fog_state = tile
+            signature = (tile_type, fog_state)
+            if last_state.get((x, y)) != signature:
+                last_state[(x, y)] = signature
+                dirty.append(tile)
+                if not (left <= x <= right and top <= y <= bottom):
+                    rebuild = True
+        
+        # New floor, fog reset or tiles outside the layer: start over
+        if rebuild or len(last_state) > len(tiles):
+            self._reset_map_layer(tiles)
+            dirty = tiles
+        
+        origin_x, origin_y = self._map_layer_origin
+        if dirty:
+            self.render_tiles(self._map_layer, [(x - origin_x, y - origin_y, tile_type, fog_state)
+                                                for x, y, tile_type, fog_state in dirty])
+        
+        screen.blit(self._map_layer, (origin_x + int(offset[0]), origin_y + int(offset[1])))
+    
+    def _reset_map_layer(self, tiles):
+        """Size a fresh map layer to cover every tile and record their signatures"""
+        if tiles:
+            left = min(x for x, _, _, _ in tiles)
+            right = max(x for x, _, _, _ in tiles)
+            top = min(y for _, y, _, _ in tiles)
+            bottom = max(y for _, y, _, _ in tiles)
+        else:
+            left = right = top = bottom = 0
+        
+        self._map_layer_bounds = (left, top, right, bottom)
+        self._map_layer_origin = (left - HEX_WIDTH, top - HEX_HEIGHT)
+        size = (right - left + 2 * HEX_WIDTH + 1, bottom - top + 2 * HEX_HEIGHT + 1)
+        
+        if self._map_layer is None or self._map_layer.get_size() != size:
+            self._map_layer = _to_display_format(pygame.Surface(size))
+        self._map_layer.fill(self.colors["background"])
+        self._last_tile_state = {(x, y): (tile_type, fog_state) for x, y, tile_type, fog_state in tiles}
     
     def render_entity_with_effects(self, screen: pygame.Surface, x: int, y: int, entity_type: str, effects: dict = None):
         """Render entity with visual effects"""
         effects = effects or {}
         
+        flags = ((self.EFFECT_ANTICIPATION if effects.get('anticipation', False) else 0)
+                 | (self.EFFECT_HIT_FLASH if effects.get('hit_flash', False) else 0)
+                 | (self.EFFECT_CRITICAL if effects.get('critical', False) else 0))
+        
+        color = self._entity_effect_colors.get((entity_type, flags))
+        if color is None:
+            color = self._effect_color(entity_type, flags)
+        
+        # Render with effects
+        self.render_entity(screen, x, y, entity_type, color)
+    
+    def _effect_color(self, entity_type: str, flags: int) -> Tuple[int, int, int]:
+        """Resolve the entity color for a combination of effect flags"""
         # Get base color
         color = self.colors.get(entity_type, (255, 255, 255))
         
         # Apply effects
-        if effects.get('anticipation', False):
+        if flags & self.EFFECT_ANTICIPATION:
             # Slightly brighten during anticipation
-            color = tuple(min(255, int(c * 1.2)) for c in color)
+            color = self._anticipation_colors.get(entity_type, (255, 255, 255))
         
-        if effects.get('hit_flash', False):
+        if flags & self.EFFECT_HIT_FLASH:
             # Flash white when hit
             color = (255, 255, 255)
         
-        if effects.get('critical', False):
+        if flags & self.EFFECT_CRITICAL:
             # Yellow tint for critical hits
             color = (255, 255, 100)
         
-        # Render with effects
-        self.render_entity(screen, x, y, entity_type, color)
+        return color
+    
+    @staticmethod
+    def _on_screen(screen: pygame.Surface, x: int, y: int) -> bool:
+        """Check whether a hex centered at (x, y) can touch the clip rect"""
+        clip = screen.get_clip()
+        return (clip.left - HEX_WIDTH <= x <= clip.right + HEX_WIDTH
+                and clip.top - HEX_HEIGHT <= y <= clip.bottom + HEX_HEIGHT)
     
     def render_entity(self, screen: pygame.Surface, x: int, y: int, entity_type: str, color_override=None):
         """Render an entity (player, enemy) with ASCII symbol"""
+        if not self._on_screen(screen, x, y):
+            return
+        
         symbol = self.symbols.get(entity_type, "?")
         color = color_override if color_override else self.colors.get(entity_type, WHITE)
         
         # Render with slight background for visibility
-        bg_vertices = HexGrid.get_hex_vertices(x, y)
-        pygame.draw.polygon(screen, (0, 0, 0, 100), bg_vertices)
+        screen.blit(self._entity_bg_surface, (x - self._hex_anchor[0], y - self._hex_anchor[1]))
         
-        text_surface = self.tile_font.render(symbol, True, color)
+        text_surface = self._get_glyph(self.tile_font, symbol, color)
         text_rect = text_surface.get_rect(center=(x, y))
         screen.blit(text_surface, text_rect)
+
+class UIRenderer:
+    """UI drawing: text, panels and bars, cached until their inputs change"""
+    
+    # Upper bound for the text surface caches
+    TEXT_CACHE_SIZE = 256
+    
+    # Health bar fill granularity (20 buckets = 5% steps)
+    HEALTH_BAR_BUCKETS = 20
+    
+    def __init__(self, fonts: Dict[str, pygame.font.Font], colors: dict):
+        self._fonts = fonts
+        self.ui_font = fonts["ui"]
+        self.small_font = fonts["small"]
+        self.colors = colors
+        
+        # Repeated UI strings keyed by (font size, text, color)
+        self._text_cache: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        
+        # Floating text surfaces keyed by (outlined, text, color)
+        self._floating_text_cache: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        
+        # Panel chrome keyed by (width, height)
+        self._panel_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        
+        # Whole-panel surfaces: name -> (input signature, surface)
+        self._panel_surfaces: Dict[str, Tuple] = {}
+        self._message_bg_cache: Dict[Tuple, pygame.Surface] = {}
+        
+        # Finished health bars keyed by (width, fill bucket, fill color)
+        self._health_bar_surfaces: Dict[Tuple, pygame.Surface] = {}
     
     def render_ui_panel(self, screen: pygame.Surface, x: int, y: int, width: int, height: int):
         """Render a UI panel with retro border"""
+        panel_surface = self._panel_cache.get((width, height))
+        if panel_surface is None:
+            panel_surface = _to_display_format(self._render_panel_chrome(width, height))
+            self._panel_cache[(width, height)] = panel_surface
+        screen.blit(panel_surface, (x, y))
+    
+    def _render_panel_chrome(self, width: int, height: int) -> pygame.Surface:
+        """Draw panel background, border and corner decorations into a surface"""
+        surface = pygame.Surface((width, height))
+        
         # Main panel
-        panel_rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(screen, (10, 10, 20), panel_rect)
-        pygame.draw.rect(screen, self.colors["ui_accent"], panel_rect, 2)
+        panel_rect = surface.get_rect()
+        pygame.draw.rect(surface, (10, 10, 20), panel_rect)
+        pygame.draw.rect(surface, self.colors["ui_accent"], panel_rect, 2)
         
         # Corner decorations
         corner_size = 8
         corners = [
-            (x, y), (x + width - corner_size, y),
-            (x, y + height - corner_size), (x + width - corner_size, y + height - corner_size)
+            (0, 0), (width - corner_size, 0),
+            (0, height - corner_size), (width - corner_size, height - corner_size)
         ]
         
         for corner_x, corner_y in corners:
-            pygame.draw.rect(screen, self.colors["ui_accent"], 
+            pygame.draw.rect(surface, self.colors["ui_accent"], 
                            (corner_x, corner_y, corner_size, corner_size))
+        return surface
     
     def render_text(self, screen: pygame.Surface, text: str, x: int, y: int, 
                    font_size: str = "ui", color: str = "ui_text"):
         """Render text with specified font and color"""
-        font = {
-            "tile": self.tile_font,
-            "ui": self.ui_font,
-            "small": self.small_font
-        }.get(font_size, self.ui_font)
-        
         text_color = self.colors.get(color, self.colors["ui_text"])
-        text_surface = font.render(text, True, text_color)
+        
+        # Repeated UI strings ("HEALTH:", "FLOOR: 3", ...) hit the LRU cache
+        key = (font_size, text, text_color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            font = self._fonts.get(font_size, self.ui_font)
+            text_surface = _to_display_format(font.render(text, True, text_color), alpha=True)
+            self._text_cache[key] = text_surface
+            if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        
         screen.blit(text_surface, (x, y))
         return text_surface.get_rect(x=x, y=y)
     
     def render_health_bar(self, screen: pygame.Surface, x: int, y: int, 
                          current: int, maximum: int, width: int = 100):
-        """Render a retro-style health bar"""
+        """Render a retro-style health bar
+        
+        The fill is quantized to 5% buckets so every bar state is a
+        pre-baked surface and drawing it is a single blit.
+        """
+        health_percent = current / maximum if maximum > 0 else None
+        
+        # Color based on health percentage
+        if health_percent is None:
+            fill_color = None  # No fill without a maximum
+        elif health_percent > 0.6:
+            fill_color = (100, 200, 100)  # Green
+        elif health_percent > 0.3:
+            fill_color = (200, 200, 100)  # Yellow
+        else:
+            fill_color = (200, 100, 100)  # Red
+        
+        bucket = 0
+        if health_percent is not None:
+            bucket = max(0, min(self.HEALTH_BAR_BUCKETS,
+                                int(self.HEALTH_BAR_BUCKETS * health_percent)))
+        
+        key = (width, bucket, fill_color)
+        bar_surface = self._health_bar_surfaces.get(key)
+        if bar_surface is None:
+            bar_surface = self._bake_health_bar(width, bucket, fill_color)
+            self._health_bar_surfaces[key] = bar_surface
+        screen.blit(bar_surface, (x, y))
+    
+    def _bake_health_bar(self, width: int, bucket: int, fill_color) -> pygame.Surface:
+        """Draw a complete health bar (background, border, fill) into a surface"""
         height = 8
+        surface = pygame.Surface((width, height))
         
         # Background
-        bg_rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(screen, (50, 20, 20), bg_rect)
-        pygame.draw.rect(screen, self.colors["ui_text"], bg_rect, 1)
+        bg_rect = surface.get_rect()
+        pygame.draw.rect(surface, (50, 20, 20), bg_rect)
+        pygame.draw.rect(surface, self.colors["ui_text"], bg_rect, 1)
         
         # Health fill
-        if maximum > 0:
-            fill_width = int(width * (current / maximum))
-            fill_rect = pygame.Rect(x + 1, y + 1, fill_width - 2, height - 2)
-            
-            # Color based on health percentage
-            health_percent = current / maximum
-            if health_percent > 0.6:
-                fill_color = (100, 200, 100)  # Green
-            elif health_percent > 0.3:
-                fill_color = (200, 200, 100)  # Yellow
-            else:
-                fill_color = (200, 100, 100)  # Red
-            
-            pygame.draw.rect(screen, fill_color, fill_rect)
+        if fill_color is not None:
+            fill_width = int(width * bucket / self.HEALTH_BAR_BUCKETS)
+            if fill_width > 2:
+                pygame.draw.rect(surface, fill_color, (1, 1, fill_width - 2, height - 2))
+        
+        return _to_display_format(surface)
     
     def render_message_panel(self, screen: pygame.Surface, message: str, message_type: str = "info"):
         """Render a non-intrusive message panel"""
@@ -206,15 +454,17 @@ class ASCIIRenderer:
         
         message_color = colors.get(message_type, self.colors["ui_text"])
         
-        # Semi-transparent background
-        bg_surface = pygame.Surface((panel_width, panel_height))
-        bg_surface.set_alpha(200)
-        bg_surface.fill((20, 20, 30))
+        # Semi-transparent background with border (cached per size and color)
+        key = (panel_width, panel_height, message_color)
+        bg_surface = self._message_bg_cache.get(key)
+        if bg_surface is None:
+            bg_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+            bg_surface.fill((20, 20, 30, 200))
+            pygame.draw.rect(bg_surface, message_color, bg_surface.get_rect(), 2)
+            bg_surface = _to_display_format(bg_surface, alpha=True)
+            self._message_bg_cache[key] = bg_surface
         screen.blit(bg_surface, (panel_x, panel_y))
         
-        # Border
-        pygame.draw.rect(screen, message_color, (panel_x, panel_y, panel_width, panel_height), 2)
-        
         # Message text
         self.render_text(screen, message, panel_x + 10, panel_y + 15, "small", message_color)
     
@@ -224,41 +474,46 @@ class ASCIIRenderer:
         if fade_alpha <= 0:
             return
         
-        # Choose font based on animation type
-        if animation_type == "damage":
-            font = self.ui_font  # Larger font for damage numbers
-        else:
-            font = self.small_font
+        outlined = animation_type == "damage"
         
         # Get color
         text_color = self.colors.get(color, self.colors["ui_text"])
         
-        # Create text surface
-        text_surface = font.render(text, True, text_color)
+        # Damage numbers repeat a lot, so the outlined surface is composited once
+        key = (outlined, text, text_color)
+        text_surface = self._floating_text_cache.get(key)
+        if text_surface is None:
+            text_surface = self._render_floating_surface(text, text_color, outlined)
+            self._floating_text_cache[key] = text_surface
+            if len(self._floating_text_cache) > self.TEXT_CACHE_SIZE:
+                self._floating_text_cache.popitem(last=False)
+        else:
+            self._floating_text_cache.move_to_end(key)
         
         # Apply fade
-        if fade_alpha < 1.0:
-            text_surface.set_alpha(int(255 * fade_alpha))
-        
-        # Add outline for damage numbers to make them more visible
-        if animation_type == "damage":
-            # Create outline
-            outline_surface = font.render(text, True, (0, 0, 0))
-            if fade_alpha < 1.0:
-                outline_surface.set_alpha(int(255 * fade_alpha))
-            
-            # Draw outline in multiple positions
-            text_rect = text_surface.get_rect(center=(x, y))
-            for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                outline_rect = text_rect.copy()
-                outline_rect.x += dx
-                outline_rect.y += dy
-                screen.blit(outline_surface, outline_rect)
-        
-        # Draw main text
+        text_surface.set_alpha(int(255 * fade_alpha) if fade_alpha < 1.0 else 255)
+        
+        # Draw text (the outline adds a 1px border around the centered text)
         text_rect = text_surface.get_rect(center=(x, y))
         screen.blit(text_surface, text_rect)
     
+    def _render_floating_surface(self, text: str, text_color, outlined: bool) -> pygame.Surface:
+        """Render floating text, baking in the black outline for damage numbers"""
+        # Choose font based on animation type
+        font = self.ui_font if outlined else self.small_font  # Larger font for damage numbers
+        text_surface = font.render(text, True, text_color)
+        if not outlined:
+            return _to_display_format(text_surface, alpha=True)
+        
+        # Draw outline in multiple positions, main text on top
+        outline_surface = font.render(text, True, (0, 0, 0))
+        width, height = text_surface.get_size()
+        composite = pygame.Surface((width + 2, height + 2), pygame.SRCALPHA)
+        for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
+            composite.blit(outline_surface, (1 + dx, 1 + dy))
+        composite.blit(text_surface, (1, 1))
+        return _to_display_format(composite, alpha=True)
+    
     def render_combat_log_panel(self, screen: pygame.Surface, combat_log: list):
         """Render combat log with retro styling"""
         if not combat_log:
@@ -269,15 +524,37 @@ class ASCIIRenderer:
         panel_x = SCREEN_WIDTH - panel_width - 10
         panel_y = 10
         
+        self._blit_cached_panel(screen, "combat_log", tuple(combat_log),
+                                pygame.Rect(panel_x, panel_y, panel_width, panel_height),
+                                lambda surface: self._draw_combat_log_panel(surface, combat_log))
+    
+    def _draw_combat_log_panel(self, surface: pygame.Surface, combat_log: list):
+        """Draw the combat log panel contents in panel-local coordinates"""
+        panel_width, panel_height = surface.get_size()
+        
         # Render panel
-        self.render_ui_panel(screen, panel_x, panel_y, panel_width, panel_height)
+        self.render_ui_panel(surface, 0, 0, panel_width, panel_height)
         
         # Title
-        self.render_text(screen, "COMBAT LOG", panel_x + 10, panel_y + 10, "ui", "ui_accent")
+        self.render_text(surface, "COMBAT LOG", 10, 10, "ui", "ui_accent")
         
         # Log entries
         for i, entry in enumerate(combat_log):
-            self.render_text(screen, entry, panel_x + 10, panel_y + 35 + i * 20, "small")
+            self.render_text(surface, format_combat_log_entry(entry), 10, 35 + i * 20, "small")
+    
+    def _blit_cached_panel(self, screen: pygame.Surface, name: str, signature, rect: pygame.Rect, draw):
+        """Blit a cached panel surface, redrawing it only when its inputs change
+        
+        draw(surface) paints the panel in local coordinates; signature is any
+        comparable snapshot of the inputs it depends on.
+        """
+        cached = self._panel_surfaces.get(name)
+        if cached is None or cached[0] != signature or cached[1].get_size() != rect.size:
+            surface = pygame.Surface(rect.size)
+            draw(surface)
+            cached = (signature, _to_display_format(surface))
+            self._panel_surfaces[name] = cached
+        screen.blit(cached[1], rect.topleft)
     
     def render_status_panel(self, screen: pygame.Surface, player, god_mode: bool = False):
         """Render player status panel"""
@@ -286,28 +563,159 @@ class ASCIIRenderer:
         panel_x = 10
         panel_y = 10
         
+        signature = (player.health, player.max_health, player.gold, player.floor, god_mode)
+        self._blit_cached_panel(screen, "status", signature,
+                                pygame.Rect(panel_x, panel_y, panel_width, panel_height),
+                                lambda surface: self._draw_status_panel(surface, player, god_mode))
+    
+    def _draw_status_panel(self, surface: pygame.Surface, player, god_mode: bool):
+        """Draw the status panel contents in panel-local coordinates"""
+        panel_width, panel_height = surface.get_size()
+        panel_x = 0
+        panel_y = 0
+        
         # Render panel
-        self.render_ui_panel(screen, panel_x, panel_y, panel_width, panel_height)
+        self.render_ui_panel(surface, panel_x, panel_y, panel_width, panel_height)
         
         # Player symbol
-        self.render_text(screen, "@", panel_x + 15, panel_y + 15, "tile", "player")
+        self.render_text(surface, "@", panel_x + 15, panel_y + 15, "tile", "player")
         
         # Stats
         y_offset = panel_y + 20
-        self.render_text(screen, f"HEALTH:", panel_x + 50, y_offset, "small", "ui_text")
-        self.render_health_bar(screen, panel_x + 120, y_offset + 2, player.health, player.max_health)
+        self.render_text(surface, "HEALTH:", panel_x + 50, y_offset, "small", "ui_text")
+        self.render_health_bar(surface, panel_x + 120, y_offset + 2, player.health, player.max_health)
         
         y_offset += 25
-        self.render_text(screen, f"GOLD: {player.gold}", panel_x + 50, y_offset, "small", "ui_accent")
+        self.render_text(surface, f"GOLD: {player.gold}", panel_x + 50, y_offset, "small", "ui_accent")
         
         y_offset += 20
-        self.render_text(screen, f"FLOOR: {player.floor}", panel_x + 50, y_offset, "small", "ui_text")
+        self.render_text(surface, f"FLOOR: {player.floor}", panel_x + 50, y_offset, "small", "ui_text")
         
         attack_power = 15 + (player.floor - 1) * 2
         y_offset += 20
-        self.render_text(screen, f"ATTACK: {attack_power}", panel_x + 50, y_offset, "small", "ui_text")
+        self.render_text(surface, f"ATTACK: {attack_power}", panel_x + 50, y_offset, "small", "ui_text")
         
         # God mode indicator
         if god_mode:
             y_offset += 20
-            self.render_text(screen, "GOD MODE: ON", panel_x + 50, y_offset, "small", "ui_accent")
+            self.render_text(surface, "GOD MODE: ON", panel_x + 50, y_offset, "small", "ui_accent")
+
+class ASCIIRenderer:
+    """Handles ASCII-style rendering with retro aesthetics
+    
+    Shares fonts, symbols and colors between a MapRenderer for the per-frame
+    map hot path and a UIRenderer for the slow-changing panels.
+    """
+    
+    def __init__(self):
+        # Initialize fonts
+        self.tile_font = pygame.font.Font(None, 48)  # Large font for tiles
+        self.ui_font = pygame.font.Font(None, 32)    # Medium font for UI
+        self.small_font = pygame.font.Font(None, 24) # Small font for details
+        self._fonts = {
+            "tile": self.tile_font,
+            "ui": self.ui_font,
+            "small": self.small_font
+        }
+        
+        # ASCII symbols for different elements
+        self.symbols = {
+            TILE_FLOOR: ".",
+            TILE_WALL: "#",
+            TILE_STAIRS_DOWN: ">",
+            TILE_STAIRS_UP: "<",
+            TILE_GOLD: "$",
+            "player": "@",
+            "goblin": "g",
+            "orc": "o", 
+            "skeleton": "s",
+            "troll": "T",
+            "unknown": " ",
+            "explored_empty": "·"  # Dimmed floor
+        }
+        
+        # Color scheme - retro terminal colors
+        self.colors = {
+            TILE_FLOOR: (100, 100, 100),      # Dark gray
+            TILE_WALL: (200, 200, 200),       # Light gray
+            TILE_STAIRS_DOWN: (100, 150, 255), # Light blue
+            TILE_STAIRS_UP: (100, 255, 100),   # Light green
+            TILE_GOLD: (255, 215, 0),          # Gold
+            "player": (255, 255, 255),         # White
+            "goblin": (255, 100, 100),         # Light red
+            "orc": (200, 50, 50),              # Dark red
+            "skeleton": (220, 220, 220),       # Off-white
+            "troll": (139, 69, 19),            # Brown
+            "background": (20, 20, 30),        # Dark blue-black
+            "ui_text": (200, 200, 200),        # Light gray
+            "ui_accent": (100, 200, 255),      # Cyan
+            "explored": (60, 60, 60),          # Very dark gray
+            "preview": (80, 80, 100),          # Dark blue-gray
+            "error": (255, 100, 100),          # Red for errors
+            "success": (100, 255, 150),        # Green for success
+            "warning": (255, 200, 100),        # Yellow for warnings
+            "ui_panel": (25, 25, 35),          # Dark panel background
+            "gold": (255, 215, 0),             # Gold color for gold messages
+            "damage_dealt": (255, 150, 100),   # Orange for damage dealt
+            "damage_received": (255, 100, 100), # Red for damage received
+            "heal": (100, 255, 100),           # Green for healing
+        }
+        
+        # Hot-path map drawing and slow-changing UI live in separate renderers
+        self.map_renderer = MapRenderer(self.tile_font, self.symbols, self.colors)
+        self.ui_renderer = UIRenderer(self._fonts, self.colors)
+    
+    # Map rendering
+    
+    def render_tile(self, screen: pygame.Surface, x: int, y: int, tile_type: int, fog_state: str = "visible"):
+        """Render a single hex tile with ASCII symbol"""
+        self.map_renderer.render_tile(screen, x, y, tile_type, fog_state)
+    
+    def render_tiles(self, screen: pygame.Surface, tiles):
+        """Render a batch of (x, y, tile_type, fog_state) hex tiles"""
+        self.map_renderer.render_tiles(screen, tiles)
+    
+    def render_map(self, screen: pygame.Surface, tiles, offset: Tuple[float, float]):
+        """Render world-space map tiles through the cached map layer"""
+        self.map_renderer.render_map(screen, tiles, offset)
+    
+    def render_entity_with_effects(self, screen: pygame.Surface, x: int, y: int, entity_type: str, effects: dict = None):
+        """Render entity with visual effects"""
+        self.map_renderer.render_entity_with_effects(screen, x, y, entity_type, effects)
+    
+    def render_entity(self, screen: pygame.Surface, x: int, y: int, entity_type: str, color_override=None):
+        """Render an entity (player, enemy) with ASCII symbol"""
+        self.map_renderer.render_entity(screen, x, y, entity_type, color_override)
+    
+    # UI rendering
+    
+    def render_ui_panel(self, screen: pygame.Surface, x: int, y: int, width: int, height: int):
+        """Render a UI panel with retro border"""
+        self.ui_renderer.render_ui_panel(screen, x, y, width, height)
+    
+    def render_text(self, screen: pygame.Surface, text: str, x: int, y: int, 
+                   font_size: str = "ui", color: str = "ui_text"):
+        """Render text with specified font and color"""
+        return self.ui_renderer.render_text(screen, text, x, y, font_size, color)
+    
+    def render_health_bar(self, screen: pygame.Surface, x: int, y: int, 
+                         current: int, maximum: int, width: int = 100):
+        """Render a retro-style health bar"""
+        self.ui_renderer.render_health_bar(screen, x, y, current, maximum, width)
+    
+    def render_message_panel(self, screen: pygame.Surface, message: str, message_type: str = "info"):
+        """Render a non-intrusive message panel"""
+        self.ui_renderer.render_message_panel(screen, message, message_type)
+    
+    def render_floating_text(self, screen: pygame.Surface, text: str, x: int, y: int, 
+                           color: str = "ui_accent", fade_alpha: float = 1.0, animation_type: str = "float"):
+        """Render floating text with fade effect and animation-specific styling"""
+        self.ui_renderer.render_floating_text(screen, text, x, y, color, fade_alpha, animation_type)
+    
+    def render_combat_log_panel(self, screen: pygame.Surface, combat_log: list):
+        """Render combat log with retro styling"""
+        self.ui_renderer.render_combat_log_panel(screen, combat_log)
+    
+    def render_status_panel(self, screen: pygame.Surface, player, god_mode: bool = False):
+        """Render player status panel"""
+        self.ui_renderer.render_status_panel(screen, player, god_mode)
@@ -5,17 +5,137 @@ Audio feedback system for enhanced game juice
 import pygame
 import random
 import os
-from typing import Dict, List, Optional, Tuple
+import queue
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
 from .game_events import GameEventType, game_events
 from .juice_manager import juice_manager
 
-class AudioManager:
+# numpy is optional; without it sounds come from the pure Python fallback
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except ImportError:
+    np = None
+    _HAS_NUMPY = False
+
+# Generated sound arrays are cached on disk; bump the version whenever a
+# generator changes so stale caches are ignored
+SOUND_CACHE_VERSION = 5
+SOUND_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "hex_dungeon_crawler",
+                                f"sounds_v{SOUND_CACHE_VERSION}.npz")
+
+# Rate the procedural sounds are generated at, matching the mixer setup
+SAMPLE_RATE = 22050
+
+# Seed for the ambient noise bed
+AMBIENT_NOISE_SEED = 0xD06
+
+# Entries in the shared sine wavetable; must be a power of two for the index mask
+SINE_LUT_SIZE = 65536
+
+# One period of sin() shared by all generators
+_SINE_LUT = (np.sin(np.linspace(0, 2 * np.pi, SINE_LUT_SIZE, False)).astype(np.float32)
+             if _HAS_NUMPY else None)
+
+# Game events with audio feedback and the handler method that plays it.
+# Each handler is subscribed directly so a dispatch is a single call.
+AUDIO_EVENT_HANDLERS = {
+    GameEventType.ATTACK_HIT: '_on_attack_hit',
+    GameEventType.ATTACK_CRIT: '_on_attack_crit',
+    GameEventType.PLAYER_HURT: '_on_player_hurt',
+    GameEventType.ENEMY_DEATH: '_on_enemy_death',
+    GameEventType.GOLD_PICKUP: '_on_gold_pickup',
+    GameEventType.SPELL_CAST: '_on_spell_cast',
+    GameEventType.MOVE_START: '_on_move_start',
+    GameEventType.FLOOR_CHANGE: '_on_floor_change',
+    GameEventType.MENU_SELECT: '_on_menu_select',
+}
+
+class _AudioEventMixin:
+    """Game event handlers shared by the audio backends, which provide play_sound"""
+    
+    __slots__ = ()
+    
+    def _subscribe_to_events(self):
+        """Subscribe to game events for audio triggers"""
+        for event_type, handler_name in AUDIO_EVENT_HANDLERS.items():
+            game_events.subscribe(event_type, getattr(self, handler_name))
+    
+    def _on_attack_hit(self, event):
+        """Handle attack hit audio"""
+        damage = event.get('damage', 0)
+        
+        # Choose sound based on damage
+        if damage >= 25:
+            self.play_sound('hit_heavy', volume=0.8)
+        else:
+            self.play_sound('hit_light', volume=0.6)
+    
+    def _on_attack_crit(self, event):
+        """Handle critical hit audio"""
+        self.play_sound('hit_crit', volume=0.8)
+    
+    def _on_player_hurt(self, event):
+        """Handle player hurt audio"""
+        damage = event.get('damage', 0)
+        
+        # Pain sound - use hit sound with different parameters
+        volume = min(0.8, 0.4 + damage * 0.02)
+        self.play_sound('hit_heavy', volume=volume, pitch=0.7)
+    
+    def _on_enemy_death(self, event):
+        """Handle enemy death audio"""
+        enemy_type = event.get('enemy_type', '')
+        
+        if 'boss' in enemy_type.lower():
+            self.play_sound('hit_heavy', volume=1.0, pitch=0.5)
+        else:
+            self.play_sound('hit_heavy', volume=0.7, pitch=0.6)
+    
+    def _on_gold_pickup(self, event):
+        """Handle gold pickup audio"""
+        amount = event.get('amount', 0)
+        
+        # Scale volume and pitch based on amount
+        volume = min(0.8, 0.3 + amount * 0.01)
+        pitch = 1.0 + min(amount * 0.005, 0.3)
+        
+        self.play_sound('gold_pickup', volume=volume, pitch=pitch)
+    
+    def _on_spell_cast(self, event):
+        """Handle spell cast audio"""
+        power = event.get('power', 1)
+        self.play_sound('spell_cast', volume=0.6 * power)
+    
+    def _on_move_start(self, event):
+        """Handle movement audio"""
+        # Subtle footstep sound
+        self.play_sound('ui_select', volume=0.1, pitch=0.8)
+    
+    def _on_floor_change(self, event):
+        """Handle floor change audio"""
+        # Magical transition sound
+        self.play_sound('spell_cast', volume=0.8, pitch=1.2)
+    
+    def _on_menu_select(self, event):
+        """Handle menu selection audio"""
+        self.play_sound('ui_select', volume=0.5)
+
+class AudioManager(_AudioEventMixin):
     """Manages all game audio with layering and dynamic effects"""
     
+    __slots__ = (
+        "audio_available", "max_channels", "_channels", "_next_channel",
+        "sounds", "sound_variations", "_pitch_cache",
+        "master_volume", "sfx_volume", "ambient_volume", "_sfx_master_volume",
+        "muted", "current_ambient", "generate_on_demand",
+    )
+    
     def __init__(self):
         # Initialize pygame mixer
         try:
-            pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
+            pygame.mixer.pre_init(frequency=SAMPLE_RATE, size=-16, channels=2, buffer=512)
             pygame.mixer.init()
             self.audio_available = True
         except pygame.error:
@@ -24,21 +144,27 @@ class AudioManager:
         
         # Audio channels for layering
         self.max_channels = 8
+        self._channels: List[pygame.mixer.Channel] = []
+        self._next_channel = 0
         if self.audio_available:
             pygame.mixer.set_num_channels(self.max_channels)
+            self._channels = [pygame.mixer.Channel(i) for i in range(self.max_channels)]
         
         # Sound libraries
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
         self.sound_variations: Dict[str, List[pygame.mixer.Sound]] = {}
+        self._pitch_cache: Dict[Tuple[str, int], pygame.mixer.Sound] = {}
         
         # Volume settings
         self.master_volume = 0.7
         self.sfx_volume = 0.8
         self.ambient_volume = 0.3
+        self._sfx_master_volume = self.sfx_volume * self.master_volume  # Kept in sync by the setters
         
         # Audio state
         self.muted = False
         self.current_ambient = None
+        self.generate_on_demand = False
         
         # Generate procedural sounds
         self._generate_procedural_sounds()
@@ -56,13 +182,16 @@ class AudioManager:
         if not self.audio_available:
             return
         
-        try:
-            # Try to use numpy for better sound generation
-            import numpy as np
-            self._generate_numpy_sounds()
-        except ImportError:
+        if not _HAS_NUMPY:
             # Fallback to simple pygame sound generation
             self._generate_simple_sounds()
+            return
+        
+        try:
+            # Use numpy for better sound generation; anything not in the
+            # disk cache is generated the first time it is played
+            self._load_cached_sounds(SOUND_CACHE_PATH)
+            self.generate_on_demand = True
         except Exception as e:
             print(f"Could not generate procedural sounds: {e}")
             self.audio_available = False
@@ -70,25 +199,29 @@ class AudioManager:
     def _generate_simple_sounds(self):
         """Generate simple sounds without numpy"""
         import array
+        import cmath
+        import itertools
         import math
+        import operator
         
-        sample_rate = 22050
+        sample_rate = SAMPLE_RATE
         
         # Generate simple sine wave sounds
         def generate_tone(frequency: float, duration: float, volume: float = 0.3):
             frames = int(duration * sample_rate)
-            arr = array.array('h')
+            amplitude = volume * 32767
+            
+            # A decaying phasor: each sample rotates by the phase step and shrinks by
+            # the decay envelope, so the imaginary part is sin(wt) * exp(-3t) without
+            # calling sin/exp per sample. accumulate runs the recurrence in C.
+            step = cmath.exp(complex(-3.0 / sample_rate, 2 * math.pi * frequency / sample_rate))
+            phasors = itertools.accumulate(itertools.repeat(step, frames - 1), operator.mul, initial=1 + 0j)
             
-            for i in range(frames):
-                time_point = float(i) / sample_rate
-                # Simple sine wave with decay
-                wave_value = int(volume * 32767 * 
-                               math.sin(2 * math.pi * frequency * time_point) *
-                               math.exp(-time_point * 3))  # Decay envelope
-                arr.append(wave_value)
-                arr.append(wave_value)  # Stereo
+            # Simple sine wave with decay, each value written to both channels
+            values = [int(amplitude * z.imag) for z in phasors]
+            arr = array.array('h', itertools.chain.from_iterable(zip(values, values)))
             
-            return pygame.sndarray.make_sound(arr)
+            return pygame.mixer.Sound(buffer=arr)
         
         # Generate basic sounds
         self.sounds['hit_light'] = generate_tone(800, 0.1, 0.3)
@@ -99,176 +232,193 @@ class AudioManager:
         self.sounds['spell_cast'] = generate_tone(600, 0.4, 0.3)
         self.sounds['ambient_dungeon'] = generate_tone(60, 2.0, 0.1)
     
-    def _generate_numpy_sounds(self):
-        """Generate enhanced sounds with numpy"""
-        sample_rate = 22050
-        
-        # Hit sounds - short percussive
-        self._generate_hit_sounds(sample_rate)
-        
-        # UI sounds - clean tones
-        self._generate_ui_sounds(sample_rate)
-        
-        # Ambient sounds - longer tones
-        self._generate_ambient_sounds(sample_rate)
-        
-        # Magic sounds - ethereal tones
-        self._generate_magic_sounds(sample_rate)
-    
-    def _generate_hit_sounds(self, sample_rate: int):
-        """Generate hit/impact sounds"""
-        import numpy as np
-        
-        # Light hit
-        duration = 0.1
-        samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
-        
-        # Sharp attack, quick decay
-        frequency = 800
-        wave = np.sin(2 * np.pi * frequency * t)
-        envelope = np.exp(-t * 15)  # Quick decay
-        audio = (wave * envelope * 0.3 * 32767).astype(np.int16)
-        
-        # Convert to stereo
-        stereo_audio = np.zeros((samples, 2), dtype=np.int16)
-        stereo_audio[:, 0] = audio
-        stereo_audio[:, 1] = audio
+    def _load_cached_sounds(self, cache_path: str):
+        """Load previously generated sounds from the disk cache, if there is one"""
+        try:
+            with np.load(cache_path) as cached:
+                for name in cached.files:
+                    self.sounds[name] = pygame.sndarray.make_sound(np.ascontiguousarray(cached[name]))
+        except Exception:
+            self.sounds.clear()  # Missing or unreadable cache
+    
+    def _save_cached_sounds(self, cache_path: str):
+        """Write every sound currently loaded or generated to the disk cache"""
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            arrays = {name: pygame.sndarray.array(sound) for name, sound in self.sounds.items()}
+            temp_path = cache_path + ".tmp.npz"
+            np.savez(temp_path, **arrays)
+            os.replace(temp_path, cache_path)  # Never leave a half-written cache behind
+        except Exception:
+            pass  # Caching is best-effort, e.g. read-only home directory
+    
+    def _get_sound(self, sound_name: str) -> Optional[pygame.mixer.Sound]:
+        """Look up a sound, generating registered ones on first use"""
+        sound = self.sounds.get(sound_name)
+        if sound is not None or not self.generate_on_demand or sound_name not in self._GENERATORS:
+            return sound
         
-        self.sounds['hit_light'] = pygame.sndarray.make_sound(stereo_audio)
+        try:
+            sound = self.sounds[sound_name] = self._generate_sound(sound_name)
+        except Exception as e:
+            print(f"Could not generate procedural sounds: {e}")
+            self.generate_on_demand = False
+            return None
         
-        # Heavy hit - lower frequency, longer
-        frequency = 400
-        duration = 0.15
+        # Rewrite the cache with everything known so far (loaded or generated),
+        # so the next launch only generates sounds never played before. Each
+        # sound is generated at most once per run, so this writes rarely.
+        self._save_cached_sounds(SOUND_CACHE_PATH)
+        return sound
+    
+    def _get_pitched_sound(self, sound_name: str, sound: pygame.mixer.Sound,
+                           pitch: float) -> pygame.mixer.Sound:
+        """Resampled copy of a sound for a pitch, memoized per (name, pitch in hundredths)"""
+        key = (sound_name, int(round(pitch * 100)))
+        pitched = self._pitch_cache.get(key)
+        if pitched is not None:
+            return pitched
+        
+        if _HAS_NUMPY:
+            samples = pygame.sndarray.array(sound)
+            frames = len(samples)
+            channels = samples.reshape(frames, -1)
+            source = np.arange(frames, dtype=np.float32)
+            positions = np.linspace(0, frames - 1, max(1, int(frames / pitch)), dtype=np.float32)
+            
+            shifted = np.empty((len(positions), channels.shape[1]), dtype=samples.dtype)
+            for channel in range(channels.shape[1]):
+                shifted[:, channel] = np.interp(positions, source, channels[:, channel])
+            pitched = pygame.sndarray.make_sound(shifted.reshape((len(positions),) + samples.shape[1:]))
+        else:
+            pitched = sound  # Without numpy the sound plays at its own pitch
+        
+        self._pitch_cache[key] = pitched
+        return pitched
+    
+    def _generate_sound(self, sound_name: str) -> pygame.mixer.Sound:
+        """Run one registered generator and convert its mono samples to stereo"""
+        audio = self._GENERATORS[sound_name](self, SAMPLE_RATE)
+        stereo_audio = np.ascontiguousarray(np.broadcast_to(audio[:, None], (len(audio), 2)))
+        return pygame.sndarray.make_sound(stereo_audio)
+    
+    @staticmethod
+    def _lut_sin(phase, out=None):
+        """Wavetable stand-in for np.sin on non-negative float32 phases"""
+        index = (phase * np.float32(SINE_LUT_SIZE / (2 * np.pi))).astype(np.int32)
+        index &= SINE_LUT_SIZE - 1
+        return np.take(_SINE_LUT, index, out=out)
+    
+    @classmethod
+    def _decaying_tone(cls, sample_rate: int, duration: float, partials: List[Tuple[float, float]],
+                       decay: float, volume: float):
+        """Sum of (frequency, weight) sine partials under an exponential decay, as int16
+        
+        Works in place on two preallocated buffers instead of allocating a
+        temporary array for every operation of the expression.
+        """
         samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
-        
-        wave = np.sin(2 * np.pi * frequency * t)
-        envelope = np.exp(-t * 8)
-        audio = (wave * envelope * 0.4 * 32767).astype(np.int16)
-        
-        stereo_audio = np.zeros((samples, 2), dtype=np.int16)
-        stereo_audio[:, 0] = audio
-        stereo_audio[:, 1] = audio
-        
-        self.sounds['hit_heavy'] = pygame.sndarray.make_sound(stereo_audio)
-        
-        # Critical hit - bright, sharp
+        t = np.linspace(0, duration, samples, False, dtype=np.float32)
+        wave = np.zeros(samples, dtype=np.float32)
+        scratch = np.empty(samples, dtype=np.float32)
+        
+        for frequency, weight in partials:
+            np.multiply(t, np.float32(2 * np.pi * frequency), out=scratch)
+            cls._lut_sin(scratch, out=scratch)
+            if weight != 1.0:
+                scratch *= np.float32(weight)
+            wave += scratch
+        
+        # Envelope
+        np.multiply(t, np.float32(-decay), out=scratch)
+        np.exp(scratch, out=scratch)
+        wave *= scratch
+        wave *= np.float32(volume * 32767)
+        return wave.astype(np.int16)
+    
+    def _generate_hit_light(self, sample_rate: int):
+        """Light hit - sharp attack, quick decay"""
+        return self._decaying_tone(sample_rate, 0.1, [(800, 1.0)], 15, 0.3)
+    
+    def _generate_hit_heavy(self, sample_rate: int):
+        """Heavy hit - lower frequency, longer"""
+        return self._decaying_tone(sample_rate, 0.15, [(400, 1.0)], 8, 0.4)
+    
+    def _generate_hit_crit(self, sample_rate: int):
+        """Critical hit - bright, sharp, with harmonics for brightness"""
         frequency = 1200
-        duration = 0.12
-        samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
-        
-        # Add harmonics for brightness
-        wave = (np.sin(2 * np.pi * frequency * t) + 
-                0.5 * np.sin(2 * np.pi * frequency * 2 * t) +
-                0.25 * np.sin(2 * np.pi * frequency * 3 * t))
-        envelope = np.exp(-t * 12)
-        audio = (wave * envelope * 0.35 * 32767).astype(np.int16)
-        
-        stereo_audio = np.zeros((samples, 2), dtype=np.int16)
-        stereo_audio[:, 0] = audio
-        stereo_audio[:, 1] = audio
-        
-        self.sounds['hit_crit'] = pygame.sndarray.make_sound(stereo_audio)
+        return self._decaying_tone(sample_rate, 0.12,
+                                   [(frequency, 1.0), (frequency * 2, 0.5), (frequency * 3, 0.25)],
+                                   12, 0.35)
     
-    def _generate_ui_sounds(self, sample_rate: int):
-        """Generate UI interaction sounds"""
-        import numpy as np
-        
-        # Menu select - pleasant tone
-        duration = 0.08
-        samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
-        
-        frequency = 600
-        wave = np.sin(2 * np.pi * frequency * t)
-        envelope = np.exp(-t * 8)
-        audio = (wave * envelope * 0.2 * 32767).astype(np.int16)
-        
-        stereo_audio = np.zeros((samples, 2), dtype=np.int16)
-        stereo_audio[:, 0] = audio
-        stereo_audio[:, 1] = audio
-        
-        self.sounds['ui_select'] = pygame.sndarray.make_sound(stereo_audio)
-        
-        # Gold pickup - bright chime
-        duration = 0.3
-        samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
-        
-        # Multiple frequencies for chime effect
-        wave = (np.sin(2 * np.pi * 800 * t) + 
-                0.7 * np.sin(2 * np.pi * 1000 * t) +
-                0.5 * np.sin(2 * np.pi * 1200 * t))
-        envelope = np.exp(-t * 3)
-        audio = (wave * envelope * 0.25 * 32767).astype(np.int16)
-        
-        stereo_audio = np.zeros((samples, 2), dtype=np.int16)
-        stereo_audio[:, 0] = audio
-        stereo_audio[:, 1] = audio
-        
-        self.sounds['gold_pickup'] = pygame.sndarray.make_sound(stereo_audio)
+    def _generate_ui_select(self, sample_rate: int):
+        """Menu select - pleasant tone"""
+        return self._decaying_tone(sample_rate, 0.08, [(600, 1.0)], 8, 0.2)
     
-    def _generate_ambient_sounds(self, sample_rate: int):
-        """Generate ambient background sounds"""
-        import numpy as np
-        
-        # Dungeon ambience - low rumble
+    def _generate_gold_pickup(self, sample_rate: int):
+        """Gold pickup - bright chime from multiple frequencies"""
+        return self._decaying_tone(sample_rate, 0.3, [(800, 1.0), (1000, 0.7), (1200, 0.5)], 3, 0.25)
+    
+    def _generate_ambient_dungeon(self, sample_rate: int):
+        """Dungeon ambience - low rumble"""
         duration = 2.0
         samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
-        
-        # Low frequency rumble with some variation
-        base_freq = 60
-        wave = (np.sin(2 * np.pi * base_freq * t) +
-                0.5 * np.sin(2 * np.pi * (base_freq * 1.5) * t) +
-                0.3 * np.random.normal(0, 0.1, samples))  # Add noise
-        
-        envelope = np.ones_like(t) * 0.1  # Constant low volume
-        audio = (wave * envelope * 32767).astype(np.int16)
+        t = np.linspace(0, duration, samples, False, dtype=np.float32)
         
-        stereo_audio = np.zeros((samples, 2), dtype=np.int16)
-        stereo_audio[:, 0] = audio
-        stereo_audio[:, 1] = audio
+        # Noise from a fixed seed so the rumble is the same every run and can be cached
+        rng = np.random.default_rng(AMBIENT_NOISE_SEED)
+        wave = rng.standard_normal(samples, dtype=np.float32)
+        wave *= np.float32(0.3 * 0.1)
         
-        self.sounds['ambient_dungeon'] = pygame.sndarray.make_sound(stereo_audio)
-    
-    def _generate_magic_sounds(self, sample_rate: int):
-        """Generate magical effect sounds"""
-        import numpy as np
-        
-        # Spell cast - ethereal sweep
+        # Low frequency rumble with some variation, accumulated in place
+        base_freq = 60
+        scratch = np.multiply(t, np.float32(2 * np.pi * base_freq))
+        wave += self._lut_sin(scratch, out=scratch)
+        np.multiply(t, np.float32(2 * np.pi * (base_freq * 1.5)), out=scratch)
+        self._lut_sin(scratch, out=scratch)
+        scratch *= np.float32(0.5)
+        wave += scratch
+        
+        wave *= np.float32(0.1 * 32767)  # Constant low volume
+        return wave.astype(np.int16)
+    
+    def _generate_spell_cast(self, sample_rate: int):
+        """Spell cast - ethereal sweep"""
         duration = 0.4
         samples = int(sample_rate * duration)
-        t = np.linspace(0, duration, samples, False)
+        t = np.linspace(0, duration, samples, False, dtype=np.float32)
         
-        # Frequency sweep from low to high
+        # Frequency sweep from low to high; the phase is the running sum of the
+        # instantaneous frequency so the pitch rises linearly
         start_freq = 200
         end_freq = 800
-        frequency = start_freq + (end_freq - start_freq) * (t / duration)
-        
-        wave = np.sin(2 * np.pi * frequency * t)
-        envelope = np.exp(-t * 2) * (1 - t / duration)  # Fade in and out
-        audio = (wave * envelope * 0.3 * 32767).astype(np.int16)
-        
-        stereo_audio = np.zeros((samples, 2), dtype=np.int16)
-        stereo_audio[:, 0] = audio
-        stereo_audio[:, 1] = audio
-        
-        self.sounds['spell_cast'] = pygame.sndarray.make_sound(stereo_audio)
-    
-    def _subscribe_to_events(self):
-        """Subscribe to game events for audio triggers"""
-        game_events.subscribe(GameEventType.ATTACK_HIT, self._on_attack_hit)
-        game_events.subscribe(GameEventType.ATTACK_CRIT, self._on_attack_crit)
-        game_events.subscribe(GameEventType.PLAYER_HURT, self._on_player_hurt)
-        game_events.subscribe(GameEventType.ENEMY_DEATH, self._on_enemy_death)
-        game_events.subscribe(GameEventType.GOLD_PICKUP, self._on_gold_pickup)
-        game_events.subscribe(GameEventType.SPELL_CAST, self._on_spell_cast)
-        game_events.subscribe(GameEventType.MOVE_START, self._on_move_start)
-        game_events.subscribe(GameEventType.FLOOR_CHANGE, self._on_floor_change)
-        game_events.subscribe(GameEventType.MENU_SELECT, self._on_menu_select)
+        phase = np.linspace(start_freq, end_freq, samples, False, dtype=np.float32)
+        np.cumsum(phase, out=phase)
+        phase *= np.float32(2 * np.pi / sample_rate)
+        
+        wave = self._lut_sin(phase, out=phase)
+        
+        # Fade in and out: exp(-2t) * (1 - t / duration), reusing t's buffer for the ramp
+        envelope = np.multiply(t, np.float32(-2))
+        np.exp(envelope, out=envelope)
+        ramp = np.multiply(t, np.float32(-1 / duration), out=t)
+        ramp += np.float32(1)
+        envelope *= ramp
+        
+        wave *= envelope
+        wave *= np.float32(0.3 * 32767)
+        return wave.astype(np.int16)
+    
+    # Numpy sound generators by name; each returns mono int16 samples
+    _GENERATORS = {
+        'hit_light': _generate_hit_light,
+        'hit_heavy': _generate_hit_heavy,
+        'hit_crit': _generate_hit_crit,
+        'ui_select': _generate_ui_select,
+        'gold_pickup': _generate_gold_pickup,
+        'ambient_dungeon': _generate_ambient_dungeon,
+        'spell_cast': _generate_spell_cast,
+    }
     
     def play_sound(self, sound_name: str, volume: float = 1.0, pitch: float = 1.0, 
                    pan: float = 0.0, layer: bool = True) -> Optional[pygame.mixer.Channel]:
@@ -276,58 +426,65 @@ class AudioManager:
         if not self.audio_available or self.muted or not juice_manager.settings.audio_enabled:
             return None
         
-        if sound_name not in self.sounds:
+        sound = self._get_sound(sound_name)
+        if sound is None:
             return None
         
-        sound = self.sounds[sound_name]
-        
         # Apply volume scaling
-        final_volume = volume * self.sfx_volume * self.master_volume * juice_manager.settings.intensity
+        final_volume = volume * self._sfx_master_volume * juice_manager.settings.intensity
         
         # Find available channel or use any if layering is disabled
         channel = None
         if layer:
-            channel = pygame.mixer.find_channel()
+            channel = self._find_channel()
         else:
-            channel = pygame.mixer.Channel(0)
+            channel = self._channels[0]
         
         if channel:
-            # Apply pitch (speed) adjustment if supported
+            # Apply pitch (speed) adjustment by resampling
             if pitch != 1.0:
-                # Note: pygame doesn't support pitch shifting directly
-                # This would require more advanced audio processing
-                pass
+                sound = self._get_pitched_sound(sound_name, sound, pitch)
             
             channel.play(sound)
-            channel.set_volume(final_volume)
             
             # Apply panning if supported
             if pan != 0.0:
                 left_vol = final_volume * (1.0 - max(0, pan))
                 right_vol = final_volume * (1.0 - max(0, -pan))
                 channel.set_volume(left_vol, right_vol)
+            else:
+                channel.set_volume(final_volume)
         
         return channel
     
-    def play_layered_sound(self, base_sound: str, layer_sounds: List[str], 
-                          volumes: List[float] = None) -> List[pygame.mixer.Channel]:
-        """Play multiple sounds layered together"""
-        channels = []
+    def _find_channel(self) -> pygame.mixer.Channel:
+        """Next idle channel in round-robin order, else the least recently started one"""
+        channels = self._channels
+        count = len(channels)
+        start = self._next_channel
+        for offset in range(count):
+            index = (start + offset) % count
+            if not channels[index].get_busy():
+                break
+        else:
+            index = start  # Every channel is busy
         
+        self._next_channel = (index + 1) % count
+        return channels[index]
+    
+    def play_layered_sound(self, base_sound: str, layer_sounds: Sequence[str], 
+                          volumes: Sequence[float] = None) -> List[pygame.mixer.Channel]:
+        """Play multiple sounds layered together"""
         # Play base sound
         base_channel = self.play_sound(base_sound)
-        if base_channel:
-            channels.append(base_channel)
         
         # Play layer sounds
         if volumes is None:
-            volumes = [0.5] * len(layer_sounds)
-        
-        for sound, volume in zip(layer_sounds, volumes):
-            channel = self.play_sound(sound, volume)
-            if channel:
-                channels.append(channel)
+            volumes = (0.5,) * len(layer_sounds)
         
+        channels = [channel for channel in map(self.play_sound, layer_sounds, volumes) if channel]
+        if base_channel:
+            channels.insert(0, base_channel)
         return channels
     
     def play_random_variant(self, sound_base: str, count: int = 3) -> Optional[pygame.mixer.Channel]:
@@ -344,6 +501,12 @@ class AudioManager:
     def set_master_volume(self, volume: float):
         """Set master volume (0.0 to 1.0)"""
         self.master_volume = max(0.0, min(1.0, volume))
+        self._sfx_master_volume = self.sfx_volume * self.master_volume
+    
+    def set_sfx_volume(self, volume: float):
+        """Set sound effect volume (0.0 to 1.0)"""
+        self.sfx_volume = max(0.0, min(1.0, volume))
+        self._sfx_master_volume = self.sfx_volume * self.master_volume
     
     def toggle_mute(self):
         """Toggle audio mute"""
@@ -360,15 +523,9 @@ class AudioManager:
     
     def _on_attack_hit(self, event):
         """Handle attack hit audio"""
-        damage = event.get('damage', 0)
+        super()._on_attack_hit(event)
         enemy_type = event.get('enemy_type', '')
         
-        # Choose sound based on damage and enemy type
-        if damage >= 25:
-            self.play_sound('hit_heavy', volume=0.8)
-        else:
-            self.play_sound('hit_light', volume=0.6)
-        
         # Add enemy-specific layer
         if 'skeleton' in enemy_type:
             # Bone clatter sound (using existing sounds as approximation)
@@ -380,15 +537,7 @@ class AudioManager:
     def _on_attack_crit(self, event):
         """Handle critical hit audio"""
         # Layered critical hit sound
-        self.play_layered_sound('hit_crit', ['hit_light'], [0.4])
-    
-    def _on_player_hurt(self, event):
-        """Handle player hurt audio"""
-        damage = event.get('damage', 0)
-        
-        # Pain sound - use hit sound with different parameters
-        volume = min(0.8, 0.4 + damage * 0.02)
-        self.play_sound('hit_heavy', volume=volume, pitch=0.7)
+        self.play_layered_sound('hit_crit', ('hit_light',), (0.4,))
     
     def _on_enemy_death(self, event):
         """Handle enemy death audio"""
@@ -396,94 +545,69 @@ class AudioManager:
         
         if 'boss' in enemy_type.lower():
             # Epic boss death sound
-            self.play_layered_sound('hit_heavy', ['hit_crit', 'spell_cast'], [0.8, 0.6])
+            self.play_layered_sound('hit_heavy', ('hit_crit', 'spell_cast'), (0.8, 0.6))
         else:
             # Regular enemy death
             self.play_sound('hit_heavy', volume=0.7, pitch=0.6)
-    
-    def _on_gold_pickup(self, event):
-        """Handle gold pickup audio"""
-        amount = event.get('amount', 0)
-        
-        # Scale volume and pitch based on amount
-        volume = min(0.8, 0.3 + amount * 0.01)
-        pitch = 1.0 + min(amount * 0.005, 0.3)
-        
-        self.play_sound('gold_pickup', volume=volume, pitch=pitch)
-    
-    def _on_spell_cast(self, event):
-        """Handle spell cast audio"""
-        spell_type = event.get('spell_type', 'arcane')
-        power = event.get('power', 1)
-        
-        volume = 0.6 * power
-        self.play_sound('spell_cast', volume=volume)
-    
-    def _on_move_start(self, event):
-        """Handle movement audio"""
-        # Subtle footstep sound
-        self.play_sound('ui_select', volume=0.1, pitch=0.8)
-    
-    def _on_floor_change(self, event):
-        """Handle floor change audio"""
-        # Magical transition sound
-        self.play_sound('spell_cast', volume=0.8, pitch=1.2)
-    
-    def _on_menu_select(self, event):
-        """Handle menu selection audio"""
-        self.play_sound('ui_select', volume=0.5)
 
-class FallbackAudio:
+class FallbackAudio(_AudioEventMixin):
     """Fallback audio system using system beeps"""
     
+    __slots__ = ("enabled", "muted", "master_volume", "_beep_queue")
+    
+    # Beep (frequency Hz, duration ms at full volume) standing in for each sound
+    BEEP_TONES = {
+        'hit_light': (800, 50),
+        'ui_select': (800, 50),
+        'hit_heavy': (400, 100),
+        'hit_crit': (1200, 80),
+        'gold_pickup': (1000, 80),
+        'spell_cast': (600, 150),
+    }
+    
     def __init__(self):
         self.enabled = True
         self.muted = False
         self.master_volume = 0.7
         
+        # Beeps fork a process (or block on Windows), so they run off the game thread
+        self._beep_queue: queue.Queue = queue.Queue(maxsize=16)
+        threading.Thread(target=self._beep_worker, name="beep", daemon=True).start()
+        
         # Subscribe to events like the main audio manager
         self._subscribe_to_events()
     
-    def _subscribe_to_events(self):
-        """Subscribe to game events for audio triggers"""
-        game_events.subscribe(GameEventType.ATTACK_HIT, self._on_attack_hit)
-        game_events.subscribe(GameEventType.ATTACK_CRIT, self._on_attack_crit)
-        game_events.subscribe(GameEventType.PLAYER_HURT, self._on_player_hurt)
-        game_events.subscribe(GameEventType.ENEMY_DEATH, self._on_enemy_death)
-        game_events.subscribe(GameEventType.GOLD_PICKUP, self._on_gold_pickup)
-        game_events.subscribe(GameEventType.SPELL_CAST, self._on_spell_cast)
-        game_events.subscribe(GameEventType.MOVE_START, self._on_move_start)
-        game_events.subscribe(GameEventType.FLOOR_CHANGE, self._on_floor_change)
-        game_events.subscribe(GameEventType.MENU_SELECT, self._on_menu_select)
-    
     def beep(self, frequency: int = 800, duration: int = 100):
-        """System beep fallback"""
+        """System beep fallback, played on the worker thread"""
         if not self.enabled or self.muted or not juice_manager.settings.audio_enabled:
             return
         
         try:
-            # Try different system beep methods
-            if os.name == 'nt':  # Windows
-                import winsound
-                winsound.Beep(frequency, duration)
-            else:  # Unix-like systems
-                os.system(f'beep -f {frequency} -l {duration} 2>/dev/null')
-        except:
-            # Silent fallback
-            pass
+            self._beep_queue.put_nowait((frequency, duration))
+        except queue.Full:
+            pass  # Drop beeps rather than stall event dispatch
+    
+    def _beep_worker(self):
+        """Play queued beeps; system beeps block for the whole tone"""
+        while True:
+            frequency, duration = self._beep_queue.get()
+            try:
+                # Try different system beep methods
+                if os.name == 'nt':  # Windows
+                    import winsound
+                    winsound.Beep(frequency, duration)
+                else:  # Unix-like systems
+                    os.system(f'beep -f {frequency} -l {duration} 2>/dev/null')
+            except:
+                # Silent fallback
+                pass
     
     def play_sound(self, sound_name: str, volume: float = 1.0, pitch: float = 1.0, **kwargs):
         """Fallback sound playing"""
-        if sound_name in ['hit_light', 'ui_select']:
-            self.beep(int(800 * pitch), int(50 * volume * 2))
-        elif sound_name in ['hit_heavy']:
-            self.beep(int(400 * pitch), int(100 * volume * 2))
-        elif sound_name == 'hit_crit':
-            self.beep(int(1200 * pitch), int(80 * volume * 2))
-        elif sound_name == 'gold_pickup':
-            self.beep(int(1000 * pitch), int(80 * volume * 2))
-        elif sound_name == 'spell_cast':
-            self.beep(int(600 * pitch), int(150 * volume * 2))
+        tone = self.BEEP_TONES.get(sound_name)
+        if tone is not None:
+            frequency, duration = tone
+            self.beep(int(frequency * pitch), int(duration * volume * 2))
         
         return None  # No channel object in fallback
     
@@ -502,48 +626,6 @@ class FallbackAudio:
     def stop_all_sounds(self):
         """Stop all sounds (no-op for fallback)"""
         pass
-    
-    # Event handlers
-    def _on_attack_hit(self, event):
-        damage = event.get('damage', 0)
-        if damage >= 25:
-            self.play_sound('hit_heavy', volume=0.8)
-        else:
-            self.play_sound('hit_light', volume=0.6)
-    
-    def _on_attack_crit(self, event):
-        self.play_sound('hit_crit', volume=0.8)
-    
-    def _on_player_hurt(self, event):
-        damage = event.get('damage', 0)
-        volume = min(0.8, 0.4 + damage * 0.02)
-        self.play_sound('hit_heavy', volume=volume, pitch=0.7)
-    
-    def _on_enemy_death(self, event):
-        enemy_type = event.get('enemy_type', '')
-        if 'boss' in enemy_type.lower():
-            self.play_sound('hit_heavy', volume=1.0, pitch=0.5)
-        else:
-            self.play_sound('hit_heavy', volume=0.7, pitch=0.6)
-    
-    def _on_gold_pickup(self, event):
-        amount = event.get('amount', 0)
-        volume = min(0.8, 0.3 + amount * 0.01)
-        pitch = 1.0 + min(amount * 0.005, 0.3)
-        self.play_sound('gold_pickup', volume=volume, pitch=pitch)
-    
-    def _on_spell_cast(self, event):
-        power = event.get('power', 1)
-        self.play_sound('spell_cast', volume=0.6 * power)
-    
-    def _on_move_start(self, event):
-        self.play_sound('ui_select', volume=0.1, pitch=0.8)
-    
-    def _on_floor_change(self, event):
-        self.play_sound('spell_cast', volume=0.8, pitch=1.2)
-    
-    def _on_menu_select(self, event):
-        self.play_sound('ui_select', volume=0.5)
 
 # Global audio manager
 try:
@@ -8,9 +8,24 @@ from .game_events import GameEventType, game_events
 from .juice_manager import juice_manager
 from .hex_grid import HexGrid
 
+def _unit_direction(dq: int, dr: int) -> Tuple[float, float]:
+    """Normalize a hex coordinate delta"""
+    length = math.sqrt(dq * dq + dr * dr)
+    return (dq / length, dr / length)
+
+# Normalized directions for the small per-turn deltas, so a step needs no sqrt
+DIRECTION_LUT = {
+    (dq, dr): _unit_direction(dq, dr)
+    for dq in range(-2, 3) for dr in range(-2, 3) if (dq, dr) != (0, 0)
+}
+
 class SmartCamera:
     """Enhanced camera with predictive movement and dramatic effects"""
     
+    # How close base position (pixels) and zoom must get to their targets to settle
+    SETTLE_DISTANCE = 0.01
+    SETTLE_ZOOM = 1e-4
+    
     def __init__(self, screen_width: int, screen_height: int):
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -42,11 +57,14 @@ class SmartCamera:
         self.base_x = 0.0
         self.base_y = 0.0
         
-        # Subscribe to events
-        game_events.subscribe(GameEventType.MOVE_START, self._on_move_start)
-        game_events.subscribe(GameEventType.ATTACK_HIT, self._on_attack_hit)
-        game_events.subscribe(GameEventType.ENEMY_DEATH, self._on_enemy_death)
-        game_events.subscribe(GameEventType.FLOOR_CHANGE, self._on_floor_change)
+        # Pixel position of the last player tile looked up, at camera offset (0, 0)
+        self._pixel_tile: Optional[Tuple[int, int]] = None
+        self._pixel_position = (0, 0)
+        
+        # Set once base and zoom have reached their targets for the current player tile
+        self._settled = False
+        
+        # Event handlers are routed by CameraManager
     
     def update(self, dt: float, player_q: int, player_r: int):
         """Update camera position with smart following"""
@@ -55,6 +73,11 @@ class SmartCamera:
             self._simple_center(player_q, player_r)
             return
         
+        # Nothing moves once the camera has settled on a player who stays put
+        if (self._settled and player_q == self.player_q and player_r == self.player_r
+                and self.zoom_level == self.target_zoom):
+            return
+        
         # Track player movement
         if player_q != self.player_q or player_r != self.player_r:
             self.last_player_q = self.player_q
@@ -64,14 +87,15 @@ class SmartCamera:
             
             # Calculate movement direction
             if self.last_player_q != 0 or self.last_player_r != 0:
-                dx = player_q - self.last_player_q
-                dy = player_r - self.last_player_r
-                length = math.sqrt(dx * dx + dy * dy)
-                if length > 0:
-                    self.movement_direction = (dx / length, dy / length)
+                delta = (player_q - self.last_player_q, player_r - self.last_player_r)
+                direction = DIRECTION_LUT.get(delta)
+                if direction is None:
+                    # Longer jumps (new floor, teleport) are normalized directly
+                    direction = _unit_direction(*delta)
+                self.movement_direction = direction
         
         # Get player pixel position
-        player_pixel_x, player_pixel_y = HexGrid.hex_to_pixel(player_q, player_r, 0, 0)
+        player_pixel_x, player_pixel_y = self.tile_pixel(player_q, player_r)
         
         # Calculate predictive offset
         prediction_offset_x = self.movement_direction[0] * 100 * self.prediction_strength
@@ -81,24 +105,43 @@ class SmartCamera:
         self.target_x = self.screen_width // 2 - (player_pixel_x + prediction_offset_x)
         self.target_y = self.screen_height // 2 - (player_pixel_y + prediction_offset_y)
         
-        # Smooth camera movement
-        self.base_x += (self.target_x - self.base_x) * self.follow_speed * dt
-        self.base_y += (self.target_y - self.base_y) * self.follow_speed * dt
+        # Smooth camera movement; exponential decay towards the target converges
+        # at the same rate whatever the frame time
+        follow = math.exp(-self.follow_speed * dt)
+        self.base_x = self.target_x + (self.base_x - self.target_x) * follow
+        self.base_y = self.target_y + (self.base_y - self.target_y) * follow
         
         # Update zoom
-        self.zoom_level += (self.target_zoom - self.zoom_level) * self.zoom_speed * dt
+        self.zoom_level = self.target_zoom + (self.zoom_level - self.target_zoom) * math.exp(-self.zoom_speed * dt)
+        
+        # Snap the last fraction of the approach so later frames can skip the math
+        self._settled = (abs(self.target_x - self.base_x) < self.SETTLE_DISTANCE and
+                         abs(self.target_y - self.base_y) < self.SETTLE_DISTANCE and
+                         abs(self.target_zoom - self.zoom_level) < self.SETTLE_ZOOM)
+        if self._settled:
+            self.base_x = self.target_x
+            self.base_y = self.target_y
+            self.zoom_level = self.target_zoom
         
         # Apply zoom to final position
         self.x = self.base_x * self.zoom_level
         self.y = self.base_y * self.zoom_level
     
+    def tile_pixel(self, q: int, r: int) -> Tuple[int, int]:
+        """Pixel position of a hex at camera offset (0, 0), memoized for the last tile"""
+        if (q, r) != self._pixel_tile:
+            self._pixel_tile = (q, r)
+            self._pixel_position = HexGrid.hex_to_pixel(q, r, 0, 0)
+        return self._pixel_position
+    
     def _simple_center(self, player_q: int, player_r: int):
         """Simple camera centering without smart features"""
-        player_pixel_x, player_pixel_y = HexGrid.hex_to_pixel(player_q, player_r, 0, 0)
+        player_pixel_x, player_pixel_y = self.tile_pixel(player_q, player_r)
         self.target_x = self.screen_width // 2 - player_pixel_x
         self.target_y = self.screen_height // 2 - player_pixel_y
         self.x = self.target_x
         self.y = self.target_y
+        self._settled = False
     
     def get_position(self) -> Tuple[int, int]:
         """Get current camera position"""
@@ -126,11 +169,6 @@ class SmartCamera:
         """Reset zoom to normal"""
         self.target_zoom = 1.0
     
-    def _on_move_start(self, event):
-        """Handle movement start for camera prediction"""
-        # Camera prediction is handled in update()
-        pass
-    
     def _on_attack_hit(self, event):
         """Handle attack hit for camera focus"""
         if not juice_manager.settings.smart_camera_enabled:
@@ -165,9 +203,27 @@ class SmartCamera:
         # Reset zoom on floor change
         self.reset_zoom()
 
+class FocusFlash:
+    """A fading radial flash anchored at a world position"""
+    
+    __slots__ = ("world_x", "world_y", "color", "intensity", "timer", "duration", "radius")
+    
+    def __init__(self, world_x: int, world_y: int, color: Tuple[int, int, int],
+                 intensity: float, duration: float, radius: int = 50):
+        self.world_x = world_x
+        self.world_y = world_y
+        self.color = color
+        self.intensity = intensity
+        self.timer = duration
+        self.duration = duration
+        self.radius = radius
+
 class LightingEffects:
     """Lighting and visual emphasis effects"""
     
+    # How close vignette and overlay must get to their targets to settle
+    SETTLE_EPSILON = 1e-4
+    
     def __init__(self):
         # Focus flash effects
         self.focus_flashes = []
@@ -183,31 +239,63 @@ class LightingEffects:
         self.target_overlay_alpha = 0.0
         self.overlay_speed = 4.0
         
-        # Subscribe to events
-        game_events.subscribe(GameEventType.ATTACK_HIT, self._on_attack_hit)
+        # Per-frame decay factors, recomputed only when the frame time changes
+        self._decay_dt = None
+        self._vignette_decay = 1.0
+        self._overlay_decay = 1.0
+        
+        # Cleared once no flash is live and vignette and overlay sit on their targets
+        self._active = False
+        
+        # Bumped whenever anything get_*_data reports may have changed
+        self.version = 0
+        
+        # Subscribe to events only this class handles; events shared with
+        # SmartCamera are routed by CameraManager
         game_events.subscribe(GameEventType.ATTACK_CRIT, self._on_attack_crit)
         game_events.subscribe(GameEventType.PLAYER_HURT, self._on_player_hurt)
-        game_events.subscribe(GameEventType.ENEMY_DEATH, self._on_enemy_death)
-        game_events.subscribe(GameEventType.FLOOR_CHANGE, self._on_floor_change)
     
     def update(self, dt: float):
         """Update lighting effects"""
+        if not self._active:
+            return
         if not juice_manager.settings.focus_flash_enabled or not juice_manager.settings.enabled:
             return
-        
-        # Update focus flashes
-        for flash in self.focus_flashes[:]:
-            flash['timer'] -= dt
-            flash['intensity'] = max(0.0, flash['timer'] / flash['duration'])
-            
-            if flash['timer'] <= 0:
-                self.focus_flashes.remove(flash)
-        
-        # Update vignette
-        self.vignette_intensity += (self.target_vignette - self.vignette_intensity) * self.vignette_speed * dt
+        self.version += 1
+        
+        # Update focus flashes, compacting survivors in place
+        flashes = self.focus_flashes
+        if flashes:
+            alive = 0
+            for flash in flashes:
+                timer = flash.timer - dt
+                if timer > 0:
+                    flash.timer = timer
+                    flash.intensity = timer / flash.duration
+                    flashes[alive] = flash
+                    alive += 1
+            del flashes[alive:]
+        
+        # Frame-rate independent exponential decay; frame times repeat, so
+        # the exp() results are reused until dt changes
+        if dt != self._decay_dt:
+            self._decay_dt = dt
+            self._vignette_decay = math.exp(-self.vignette_speed * dt)
+            self._overlay_decay = math.exp(-self.overlay_speed * dt)
+        
+        # Update vignette, snapping the last fraction of the approach
+        target = self.target_vignette
+        vignette = target + (self.vignette_intensity - target) * self._vignette_decay
+        vignette_settled = abs(vignette - target) < self.SETTLE_EPSILON
+        self.vignette_intensity = target if vignette_settled else vignette
         
         # Update color overlay
-        self.overlay_alpha += (self.target_overlay_alpha - self.overlay_alpha) * self.overlay_speed * dt
+        target = self.target_overlay_alpha
+        overlay = target + (self.overlay_alpha - target) * self._overlay_decay
+        overlay_settled = abs(overlay - target) < self.SETTLE_EPSILON
+        self.overlay_alpha = target if overlay_settled else overlay
+        
+        self._active = bool(flashes) or not (vignette_settled and overlay_settled)
     
     def add_focus_flash(self, q: int, r: int, color: Tuple[int, int, int] = (255, 255, 255), 
                        intensity: float = 0.8, duration: float = 0.2):
@@ -216,18 +304,13 @@ class LightingEffects:
             return
         
         # Convert hex to world position
-        from .hex_grid import HexGrid
         world_x, world_y = HexGrid.hex_to_pixel(q, r, 0, 0)
         
-        self.focus_flashes.append({
-            'world_x': world_x,  # Store world position
-            'world_y': world_y,
-            'color': color,
-            'intensity': intensity * juice_manager.settings.intensity,
-            'timer': duration,
-            'duration': duration,
-            'radius': 50
-        })
+        self.focus_flashes.append(FocusFlash(
+            world_x, world_y, color, intensity * juice_manager.settings.intensity, duration
+        ))
+        self._active = True
+        self.version += 1
     
     def set_vignette(self, intensity: float, duration: float = 0.5):
         """Set vignette intensity"""
@@ -235,6 +318,8 @@ class LightingEffects:
             return
         
         self.target_vignette = max(0.0, min(1.0, intensity * juice_manager.settings.intensity))
+        self._active = True
+        self.version += 1
     
     def set_color_overlay(self, color: Tuple[int, int, int], alpha: float, duration: float = 0.5):
         """Set color overlay effect"""
@@ -243,10 +328,12 @@ class LightingEffects:
         
         self.color_overlay = color
         self.target_overlay_alpha = max(0.0, min(1.0, alpha * juice_manager.settings.intensity))
+        self._active = True
+        self.version += 1
     
     def get_focus_flashes(self) -> list:
-        """Get current focus flashes for rendering"""
-        return self.focus_flashes.copy()
+        """Get current focus flashes for rendering (live list, do not mutate)"""
+        return self.focus_flashes
     
     def get_vignette_data(self) -> dict:
         """Get vignette data for rendering"""
@@ -331,6 +418,18 @@ class CameraManager:
         self.camera_x = 0
         self.camera_y = 0
         self.zoom = 1.0
+        
+        # Lighting data handed to the renderer, rebuilt when lighting changes
+        self._lighting_data: Optional[dict] = None
+        self._lighting_version = -1
+        
+        # (player_q, player_r, shake_x, shake_y) behind the current simple-centering position
+        self._simple_key: Optional[Tuple[int, int, float, float]] = None
+        
+        # One subscription per event both children react to, dispatched directly
+        game_events.subscribe(GameEventType.ATTACK_HIT, self._on_attack_hit)
+        game_events.subscribe(GameEventType.ENEMY_DEATH, self._on_enemy_death)
+        game_events.subscribe(GameEventType.FLOOR_CHANGE, self._on_floor_change)
     
     def update(self, dt: float, player_q: int, player_r: int):
         """Update camera and lighting systems"""
@@ -342,17 +441,23 @@ class CameraManager:
             self.smart_camera.update(dt, player_q, player_r)
             base_x, base_y = self.smart_camera.get_position()
             self.zoom = self.smart_camera.get_zoom()
+            self._simple_key = None
+            
+            # Apply shake from juice manager
+            shake_x, shake_y = juice_manager.get_camera_offset()
         else:
-            # Use simple centering
-            from .hex_grid import HexGrid
-            player_pixel_x, player_pixel_y = HexGrid.hex_to_pixel(player_q, player_r, 0, 0)
+            # Use simple centering; the position only changes with the tile or the shake
+            shake_x, shake_y = juice_manager.get_camera_offset()
+            simple_key = (player_q, player_r, shake_x, shake_y)
+            if simple_key == self._simple_key:
+                return
+            self._simple_key = simple_key
+            
+            player_pixel_x, player_pixel_y = self.smart_camera.tile_pixel(player_q, player_r)
             base_x = self.smart_camera.screen_width // 2 - player_pixel_x
             base_y = self.smart_camera.screen_height // 2 - player_pixel_y
             self.zoom = 1.0
         
-        # Apply shake from juice manager
-        shake_x, shake_y = juice_manager.get_camera_offset()
-        
         self.camera_x = int(base_x + shake_x)
         self.camera_y = int(base_y + shake_y)
     
@@ -365,12 +470,16 @@ class CameraManager:
         return self.zoom
     
     def get_lighting_data(self) -> dict:
-        """Get all lighting effect data for rendering"""
-        return {
-            'focus_flashes': self.lighting_effects.get_focus_flashes(),
-            'vignette': self.lighting_effects.get_vignette_data(),
-            'color_overlay': self.lighting_effects.get_color_overlay_data()
-        }
+        """Get all lighting effect data for rendering (shared, do not mutate)"""
+        lighting = self.lighting_effects
+        if lighting.version != self._lighting_version:
+            self._lighting_version = lighting.version
+            self._lighting_data = {
+                'focus_flashes': lighting.get_focus_flashes(),
+                'vignette': lighting.get_vignette_data(),
+                'color_overlay': lighting.get_color_overlay_data()
+            }
+        return self._lighting_data
     
     def focus_on_position(self, q: int, r: int, zoom: float = 1.2):
         """Focus camera on specific position"""
@@ -378,15 +487,30 @@ class CameraManager:
     
     def center_on_player(self, player_q: int, player_r: int):
         """Center camera on player (for initialization)"""
+        self._simple_key = None
         if juice_manager.settings.smart_camera_enabled and juice_manager.settings.enabled:
             self.smart_camera._simple_center(player_q, player_r)
             self.camera_x, self.camera_y = self.smart_camera.get_position()
         else:
             # Use simple centering when smart camera is disabled
-            from .hex_grid import HexGrid
             player_pixel_x, player_pixel_y = HexGrid.hex_to_pixel(player_q, player_r, 0, 0)
             self.camera_x = self.smart_camera.screen_width // 2 - player_pixel_x
             self.camera_y = self.smart_camera.screen_height // 2 - player_pixel_y
+    
+    def _on_attack_hit(self, event):
+        """Route attack hit to camera and lighting"""
+        self.smart_camera._on_attack_hit(event)
+        self.lighting_effects._on_attack_hit(event)
+    
+    def _on_enemy_death(self, event):
+        """Route enemy death to camera and lighting"""
+        self.smart_camera._on_enemy_death(event)
+        self.lighting_effects._on_enemy_death(event)
+    
+    def _on_floor_change(self, event):
+        """Route floor change to camera and lighting"""
+        self.smart_camera._on_floor_change(event)
+        self.lighting_effects._on_floor_change(event)
 
 # Global camera manager (will be initialized by game engine)
 camera_manager: Optional[CameraManager] = None
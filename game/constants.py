@@ -45,6 +45,7 @@ TILE_STAIRS_DOWN = 2
 TILE_STAIRS_UP = 3
 TILE_GOLD = 4
 TILE_ENEMY = 5
+MAX_TILE_ID = TILE_ENEMY
 
 # Tile colors
 TILE_COLORS = {
@@ -2,17 +2,32 @@
 Dungeon generation and management
 """
 
+import itertools
 import random
 import pygame
 from typing import Dict, Tuple, List, Optional
 from .constants import *
-from .hex_grid import HexGrid
+from .hex_grid import HEX_VERTEX_OFFSETS, HexGrid
 from .enemy import Enemy, create_enemy_for_floor
 from .nuclear_throne_generator import NuclearThroneGenerator
 
+# Tiles the player and enemies can stand on
+WALKABLE_TILES = frozenset((TILE_FLOOR, TILE_STAIRS_DOWN, TILE_STAIRS_UP, TILE_GOLD))
+
+# Fallback (non-ASCII) tile colors for each fog state
+FOG_TILE_COLORS = {
+    "visible": TILE_COLORS,
+    "explored": {tile_type: tuple(c // 3 for c in color) for tile_type, color in TILE_COLORS.items()},
+    "preview": {tile_type: tuple(c // 2 for c in color) for tile_type, color in TILE_COLORS.items()},
+}
+
 class Dungeon:
     """Dungeon floor with hexagonal grid"""
     
+    # Wall border around the packed tile grid; any hex within this many steps of
+    # a generated tile can index the grid without a bounds check
+    GRID_PADDING = 4
+    
     def __init__(self, width: int, height: int, floor_number: int):
         self.width = width
         self.height = height
@@ -21,9 +36,26 @@ class Dungeon:
         self.enemies: Dict[Tuple[int, int], Enemy] = {}
         self.player_start: Optional[Tuple[int, int]] = None
         self.stairs_down: Optional[Tuple[int, int]] = None
+        self._world_positions: Optional[Dict[Tuple[int, int], Tuple[int, int]]] = None
+        self._floor_tiles: List[Tuple[int, int]] = []
+        
+        # Dense copy of self.tiles: tile id of (q, r) is tile_grid[r * grid_stride + q + grid_offset]
+        self.tile_grid = bytearray()
+        self.grid_stride = 0
+        self.grid_offset = 0
+        self.grid_origin = (0, 0)  # (q, r) stored at index 0
         
         self.generate_dungeon()
     
+    def regenerate(self, floor_number: int):
+        """Replace this dungeon's contents with a freshly generated floor"""
+        self.floor_number = floor_number
+        self.enemies.clear()
+        self.player_start = None
+        self.stairs_down = None
+        self._world_positions = None
+        self.generate_dungeon()
+    
     def generate_dungeon(self):
         """Generate dungeon using Nuclear Throne-style algorithm"""
         generator = NuclearThroneGenerator(self.width, self.height)
@@ -35,19 +67,42 @@ class Dungeon:
                 self.stairs_down = pos
                 break
         
+        self._build_tile_grid()
+        
+        # Floor positions only change when gold is picked up, which appends to this list
+        self._floor_tiles = [pos for pos, tile_type in self.tiles.items() if tile_type == TILE_FLOOR]
+        
         # Place enemies on floor tiles (away from player start)
         self._place_enemies()
     
+    def _build_tile_grid(self):
+        """Pack the tile dict into a row-major bytearray of tile ids"""
+        padding = self.GRID_PADDING
+        min_q = min(q for q, _ in self.tiles) - padding
+        max_q = max(q for q, _ in self.tiles) + padding
+        min_r = min(r for _, r in self.tiles) - padding
+        max_r = max(r for _, r in self.tiles) + padding
+        
+        stride = max_q - min_q + 1
+        offset = -(min_r * stride + min_q)
+        grid = bytearray([TILE_WALL]) * (stride * (max_r - min_r + 1))
+        for (q, r), tile_type in self.tiles.items():
+            grid[r * stride + q + offset] = tile_type
+        
+        self.tile_grid = grid
+        self.grid_stride = stride
+        self.grid_offset = offset
+        self.grid_origin = (min_q, min_r)
+    
     def _place_enemies(self):
         """Place enemies on the generated floor"""
-        floor_tiles = [(q, r) for (q, r), tile_type in self.tiles.items() 
-                      if tile_type == TILE_FLOOR]
-        
-        # Remove tiles too close to player start
+        # Floor tiles minus those too close to player start: rather than measuring
+        # every tile, rule out the small disk of hexes around the start
+        floor_tiles = self._floor_tiles
         if self.player_start:
             safe_distance = 3
-            floor_tiles = [(q, r) for (q, r) in floor_tiles 
-                          if HexGrid.hex_distance(q, r, self.player_start[0], self.player_start[1]) >= safe_distance]
+            too_close = set(HexGrid.get_hex_disk(*self.player_start, safe_distance - 1))
+            floor_tiles = [pos for pos in floor_tiles if pos not in too_close]
         
         # Place enemies (more on higher floors)
         num_enemies = random.randint(2, 4 + self.floor_number // 2)
@@ -63,18 +118,22 @@ class Dungeon:
     
     def is_walkable(self, q: int, r: int) -> bool:
         """Check if a tile is walkable"""
-        tile_type = self.get_tile(q, r)
         # Can walk on floors, stairs, gold, and tiles with enemies
-        return tile_type in [TILE_FLOOR, TILE_STAIRS_DOWN, TILE_STAIRS_UP, TILE_GOLD] or (q, r) in self.enemies
+        return self.get_tile(q, r) in WALKABLE_TILES or (q, r) in self.enemies
     
     def has_enemy(self, q: int, r: int) -> bool:
         """Check if there's an enemy at this position"""
-        return (q, r) in self.enemies and self.enemies[(q, r)].alive
+        enemy = self.enemies.get((q, r))
+        return enemy is not None and enemy.alive
     
     def get_enemy(self, q: int, r: int) -> Optional[Enemy]:
         """Get enemy at position"""
         return self.enemies.get((q, r))
     
+    def remove_enemy(self, q: int, r: int) -> Optional[Enemy]:
+        """Take the enemy at this position off the floor, if there is one"""
+        return self.enemies.pop((q, r), None)
+    
     def interact_with_tile(self, q: int, r: int, player) -> str:
         """Interact with a tile and return a message"""
         # Check for enemy first
@@ -87,6 +146,8 @@ class Dungeon:
             gold_amount = random.randint(10, 30) * self.floor_number
             player.collect_gold(gold_amount)
             self.tiles[(q, r)] = TILE_FLOOR
+            self.tile_grid[r * self.grid_stride + q + self.grid_offset] = TILE_FLOOR
+            self._floor_tiles.append((q, r))
             return f"Found {gold_amount} gold!"
         
         elif tile_type == TILE_STAIRS_DOWN:
@@ -96,58 +157,60 @@ class Dungeon:
     
     def process_enemy_turns(self, player_q: int, player_r: int):
         """Process all enemy turns (turn-based)"""
+        # Every enemy decides against the positions at the start of the turn;
+        # the dict is then rebuilt once, with movers after those that stayed
+        enemies = {}
         enemies_to_move = []
         
         for pos, enemy in self.enemies.items():
-            if enemy.alive:
-                new_pos = enemy.process_turn(player_q, player_r, self)
-                if new_pos and new_pos != pos:
-                    enemies_to_move.append((pos, new_pos, enemy))
+            new_pos = enemy.process_turn(player_q, player_r, self) if enemy.alive else None
+            if new_pos and new_pos != pos:
+                enemies_to_move.append((pos, new_pos, enemy))
+            else:
+                enemies[pos] = enemy
         
         # Move enemies to new positions
         for old_pos, new_pos, enemy in enemies_to_move:
-            # Remove from old position
-            del self.enemies[old_pos]
-            # Move enemy
+            if new_pos in enemies:
+                # Another enemy already took this tile this turn, stay put
+                enemies[old_pos] = enemy
+                continue
             enemy.move_to(new_pos[0], new_pos[1])
-            # Add to new position
-            self.enemies[new_pos] = enemy
+            enemies[new_pos] = enemy
+        
+        self.enemies = enemies
     
     def render(self, screen: pygame.Surface, offset_x: int, offset_y: int, fog_of_war=None, ascii_renderer=None):
         """Render the dungeon"""
-        # Render tiles
-        for (q, r), tile_type in self.tiles.items():
-            x, y = HexGrid.hex_to_pixel(q, r, offset_x, offset_y)
-            
-            # Determine fog state
-            fog_state = "unknown"
-            if fog_of_war:
-                if fog_of_war.is_visible(q, r):
-                    if fog_of_war.is_explored(q, r):
-                        fog_state = "visible"
-                    else:
-                        fog_state = "preview"
-                elif fog_of_war.is_explored(q, r):
-                    fog_state = "explored"
-            else:
-                fog_state = "visible"
-            
-            # Skip unknown tiles
-            if fog_state == "unknown":
-                continue
+        # Determine fog states for all tiles in one batch, in tile order
+        if fog_of_war:
+            fog_states = fog_of_war.get_states(self.tiles)
+        else:
+            fog_states = itertools.repeat("visible")
+        tile_states = zip(self.tiles.items(), fog_states)
+        
+        # Render tiles, skipping unknown ones
+        if ascii_renderer:
+            if self._world_positions is None:
+                # Tile positions never change within a floor
+                self._world_positions = {pos: HexGrid.hex_to_world_pixel(*pos) for pos in self.tiles}
+            world_positions = self._world_positions
             
-            # Use ASCII renderer if available
-            if ascii_renderer:
-                ascii_renderer.render_tile(screen, x, y, tile_type, fog_state)
-            else:
-                # Fallback to old rendering
-                vertices = HexGrid.get_hex_vertices(x, y)
-                color = TILE_COLORS.get(tile_type, BLACK)
+            # Tiles handed to the ASCII renderer go through its world-space map layer
+            ascii_tiles = [(*world_positions[pos], tile_type, fog_state)
+                           for (pos, tile_type), fog_state in tile_states
+                           if fog_state != "unknown"]
+            if ascii_tiles:
+                ascii_renderer.render_map(screen, ascii_tiles, (offset_x, offset_y))
+        else:
+            # Fallback to old rendering
+            for ((q, r), tile_type), fog_state in tile_states:
+                if fog_state == "unknown":
+                    continue
                 
-                if fog_state == "explored":
-                    color = tuple(c // 3 for c in color)
-                elif fog_state == "preview":
-                    color = tuple(c // 2 for c in color)
+                x, y = HexGrid.hex_to_pixel(q, r, offset_x, offset_y)
+                vertices = [(int(x + dx), int(y + dy)) for dx, dy in HEX_VERTEX_OFFSETS]
+                color = FOG_TILE_COLORS[fog_state].get(tile_type, BLACK)
                 
                 pygame.draw.polygon(screen, color, vertices)
                 pygame.draw.polygon(screen, BLACK, vertices, 2)
@@ -161,4 +224,3 @@ class Dungeon:
                     ascii_renderer.render_entity(screen, x, y, enemy.enemy_type)
                 else:
                     enemy.render(screen, offset_x, offset_y)
-                enemy.render(screen, offset_x, offset_y)
@@ -2,15 +2,71 @@
 Enemy classes and combat system
 """
 
+import itertools
 import random
 import pygame
-from typing import Tuple, List, Optional
+from typing import Dict, Tuple, List, Optional
 from .constants import *
-from .hex_grid import HexGrid
+from .hex_grid import HEX_DIRECTIONS, HexGrid
+
+# (health, attack, defense, gold, color) per enemy type
+ENEMY_STATS = {
+    "goblin": (20, 8, 2, 15, RED),
+    "orc": (35, 12, 4, 25, (150, 0, 0)),
+    "skeleton": (15, 10, 1, 10, (200, 200, 200)),
+    "troll": (60, 18, 8, 50, (100, 50, 0)),
+}
+
+# (move_frequency, detection_range, chase_range) per enemy type
+ENEMY_BEHAVIOR_STATS = {
+    "goblin": (2, 2, 4),
+    "orc": (3, 3, 5),
+    "skeleton": (1, 4, 6),
+    "troll": (4, 2, 3),
+}
+
+# Every order in which a wandering enemy can try the 6 hex directions
+_DIRECTION_PERMUTATIONS = tuple(itertools.permutations(range(len(HEX_DIRECTIONS))))
+
+# ASCII symbols for different enemy types
+ENEMY_SYMBOLS = {
+    "goblin": "g",
+    "orc": "o",
+    "skeleton": "s",
+    "troll": "T"
+}
+
+# Combat log entries are (kind, *args) tuples, formatted only when displayed
+COMBAT_LOG_FORMATS = {
+    "player_hit": "You deal {0} damage to {1}",
+    "enemy_defeated": "{0} defeated! Gained {1} gold",
+    "enemy_hit": "{0} deals {1} damage to you",
+    "player_defeated": "You have been defeated!",
+}
+
+def format_combat_log_entry(entry: Tuple) -> str:
+    """Turn a combat log entry into its display text"""
+    return COMBAT_LOG_FORMATS[entry[0]].format(*entry[1:])
 
 class Enemy:
     """Base enemy class with AI behavior"""
     
+    # Dungeons hold many enemies and the turn loop reads these constantly
+    __slots__ = ('q', 'r', 'enemy_type', 'alive',
+                 'max_health', 'health', 'attack', 'defense', 'gold_reward', 'color', 'size',
+                 'move_frequency', 'detection_range', 'chase_range',
+                 'state', 'last_known_player_pos', 'wander_direction', 'turns_since_move')
+    
+    # Shared by every enemy, created on first render
+    _FONT: Optional[pygame.font.Font] = None
+    
+    # Rendered glyph per (enemy_type, color)
+    _GLYPH_CACHE: Dict[Tuple[str, Tuple[int, int, int]], pygame.Surface] = {}
+    
+    # Health bar geometry
+    HEALTH_BAR_WIDTH = HEX_RADIUS
+    HEALTH_BAR_HEIGHT = 3
+    
     def __init__(self, q: int, r: int, enemy_type: str = "goblin"):
         self.q = q
         self.r = r
@@ -34,33 +90,14 @@ class Enemy:
         
     def _set_stats(self):
         """Set enemy stats based on type"""
-        enemy_stats = {
-            "goblin": {"health": 20, "attack": 8, "defense": 2, "gold": 15, "color": RED},
-            "orc": {"health": 35, "attack": 12, "defense": 4, "gold": 25, "color": (150, 0, 0)},
-            "skeleton": {"health": 15, "attack": 10, "defense": 1, "gold": 10, "color": (200, 200, 200)},
-            "troll": {"health": 60, "attack": 18, "defense": 8, "gold": 50, "color": (100, 50, 0)},
-        }
-        
-        stats = enemy_stats.get(self.enemy_type, enemy_stats["goblin"])
-        self.max_health = stats["health"]
+        (self.max_health, self.attack, self.defense,
+         self.gold_reward, self.color) = ENEMY_STATS.get(self.enemy_type, ENEMY_STATS["goblin"])
         self.health = self.max_health
-        self.attack = stats["attack"]
-        self.defense = stats["defense"]
-        self.gold_reward = stats["gold"]
-        self.color = stats["color"]
         
         # Set different move frequencies and behaviors for enemy types
-        behavior_stats = {
-            "goblin": {"move_frequency": 2, "detection_range": 2, "chase_range": 4},
-            "orc": {"move_frequency": 3, "detection_range": 3, "chase_range": 5},
-            "skeleton": {"move_frequency": 1, "detection_range": 4, "chase_range": 6},
-            "troll": {"move_frequency": 4, "detection_range": 2, "chase_range": 3},
-        }
-        
-        behavior = behavior_stats.get(self.enemy_type, behavior_stats["goblin"])
-        self.move_frequency = behavior["move_frequency"]  # Turns between moves
-        self.detection_range = behavior["detection_range"]
-        self.chase_range = behavior["chase_range"]
+        (self.move_frequency,  # Turns between moves
+         self.detection_range,
+         self.chase_range) = ENEMY_BEHAVIOR_STATS.get(self.enemy_type, ENEMY_BEHAVIOR_STATS["goblin"])
     
     def take_damage(self, damage: int) -> int:
         """Take damage and return actual damage dealt"""
@@ -87,53 +124,47 @@ class Enemy:
         if not self.alive:
             return None
         
+        # Check if it's time to move based on enemy type frequency
         self.turns_since_move += 1
+        if self.turns_since_move < self.move_frequency:
+            return None
+        self.turns_since_move = 0
         
-        # Check if it's time to move based on enemy type frequency
-        if self.turns_since_move >= self.move_frequency:
-            self.turns_since_move = 0
-            
-            # Calculate distance to player
-            distance_to_player = HexGrid.hex_distance(self.q, self.r, player_q, player_r)
-            
-            # State transitions
-            if distance_to_player <= self.detection_range:
-                self.state = "chasing"
-                self.last_known_player_pos = (player_q, player_r)
-            elif self.state == "chasing" and distance_to_player > self.chase_range:
-                self.state = "wandering"
-                self.last_known_player_pos = None
-            
-            # Behavior based on state
-            new_pos = None
-            if self.state == "chasing":
-                new_pos = self._chase_behavior(player_q, player_r, dungeon)
-            elif self.state == "wandering":
-                new_pos = self._wander_behavior(dungeon, player_q, player_r)
-            
-            return new_pos
+        # Calculate distance to player
+        distance_to_player = HexGrid.hex_distance(self.q, self.r, player_q, player_r)
         
-        return None
+        # State transitions
+        if distance_to_player <= self.detection_range:
+            self.state = "chasing"
+            self.last_known_player_pos = (player_q, player_r)
+        elif self.state == "chasing" and distance_to_player > self.chase_range:
+            self.state = "wandering"
+            self.last_known_player_pos = None
+        
+        # Behavior based on state
+        behavior = self._STATE_BEHAVIORS.get(self.state)
+        return behavior(self, player_q, player_r, dungeon) if behavior else None
     
     def _chase_behavior(self, player_q: int, player_r: int, dungeon) -> Optional[Tuple[int, int]]:
         """Chase the player"""
-        # Get all possible moves
-        neighbors = HexGrid.get_hex_neighbors(self.q, self.r)
-        valid_moves = []
+        # Move to the valid neighbour closest to the player; ties go to the
+        # first one in neighbour order
+        best_move = None
+        best_distance = 0
         
-        for nq, nr in neighbors:
+        for dq, dr in HEX_DIRECTIONS:
+            nq = self.q + dq
+            nr = self.r + dr
             if self._can_move_to(nq, nr, dungeon, player_q, player_r):
-                # Calculate distance to player from this position
-                distance = HexGrid.hex_distance(nq, nr, player_q, player_r)
-                valid_moves.append((nq, nr, distance))
+                # Distance to player from this position (inlined hex_distance)
+                to_q = nq - player_q
+                to_r = nr - player_r
+                distance = (abs(to_q) + abs(to_q + to_r) + abs(to_r)) // 2
+                if best_move is None or distance < best_distance:
+                    best_move = (nq, nr)
+                    best_distance = distance
         
-        if valid_moves:
-            # Move to position closest to player
-            valid_moves.sort(key=lambda x: x[2])
-            best_move = valid_moves[0]
-            return (best_move[0], best_move[1])
-        
-        return None
+        return best_move
     
     def _wander_behavior(self, dungeon, player_q: int = None, player_r: int = None) -> Optional[Tuple[int, int]]:
         """Wander randomly around the dungeon"""
@@ -145,31 +176,37 @@ class Enemy:
             if self._can_move_to(target_q, target_r, dungeon, player_q, player_r):
                 return (target_q, target_r)
         
-        # If can't continue, try random directions
-        random.shuffle(neighbors)
-        for nq, nr in neighbors:
+        # If can't continue, try random directions; picking a whole permutation
+        # with one draw leaves the neighbor list untouched
+        for direction in _DIRECTION_PERMUTATIONS[random.randrange(len(_DIRECTION_PERMUTATIONS))]:
+            nq, nr = neighbors[direction]
             if self._can_move_to(nq, nr, dungeon, player_q, player_r):
                 # Update wander direction
-                self.wander_direction = neighbors.index((nq, nr))
+                self.wander_direction = direction
                 return (nq, nr)
         
         return None
     
+    # Turn behavior per AI state, called as behavior(self, player_q, player_r, dungeon)
+    _STATE_BEHAVIORS = {
+        "chasing": _chase_behavior,
+        "wandering": lambda self, player_q, player_r, dungeon: self._wander_behavior(dungeon, player_q, player_r),
+    }
+    
     def _can_move_to(self, q: int, r: int, dungeon, player_q: int = None, player_r: int = None) -> bool:
         """Check if enemy can move to this position"""
+        # Cheapest test first: can't move into player's tile
+        if q == player_q and r == player_r:
+            return False
+        
         # Can't move to walls
         if not dungeon.is_walkable(q, r):
             return False
         
         # Can't move to positions with other enemies
-        if dungeon.has_enemy(q, r) and (q, r) != (self.q, self.r):
+        if dungeon.has_enemy(q, r) and (q != self.q or r != self.r):
             return False
         
-        # Can't move into player's tile
-        if player_q is not None and player_r is not None:
-            if q == player_q and r == player_r:
-                return False
-        
         return True
     
     def move_to(self, new_q: int, new_r: int):
@@ -184,26 +221,22 @@ class Enemy:
             
         x, y = HexGrid.hex_to_pixel(self.q, self.r, offset_x, offset_y)
         
-        # ASCII symbols for different enemy types
-        symbols = {
-            "goblin": "g",
-            "orc": "o", 
-            "skeleton": "s",
-            "troll": "T"
-        }
-        
-        symbol = symbols.get(self.enemy_type, "?")
-        
-        # Use a font for ASCII rendering
-        font = pygame.font.Font(None, 48)
-        text_surface = font.render(symbol, True, self.color)
+        key = (self.enemy_type, self.color)
+        text_surface = Enemy._GLYPH_CACHE.get(key)
+        if text_surface is None:
+            # Use a font for ASCII rendering
+            if Enemy._FONT is None:
+                Enemy._FONT = pygame.font.Font(None, 48)
+            symbol = ENEMY_SYMBOLS.get(self.enemy_type, "?")
+            text_surface = Enemy._FONT.render(symbol, True, self.color)
+            Enemy._GLYPH_CACHE[key] = text_surface
         text_rect = text_surface.get_rect(center=(x, y))
         screen.blit(text_surface, text_rect)
         
         # Draw health bar if damaged
         if self.health < self.max_health:
-            bar_width = HEX_RADIUS
-            bar_height = 3
+            bar_width = self.HEALTH_BAR_WIDTH
+            bar_height = self.HEALTH_BAR_HEIGHT
             bar_x = x - bar_width // 2
             bar_y = y - HEX_RADIUS - 5
             
@@ -225,43 +258,49 @@ class CombatSystem:
         combat_log = []
         damage_events = []  # Track damage for floating numbers
         
-        # Combat continues until one dies
+        # Nobody moves during a fight, so names and positions are fixed
+        enemy_name = enemy.enemy_type.title()
+        enemy_position = (enemy.q, enemy.r)
+        player_position = (player.q, player.r)
+        calculate_player_damage = CombatSystem._calculate_player_damage
+        
+        # Combat continues until one dies; rounds are resolved one at a time
+        # so random draws stay in attack order
         while player.health > 0 and enemy.alive:
             # Player attacks first
-            player_damage = CombatSystem._calculate_player_damage(player)
-            actual_damage = enemy.take_damage(player_damage)
-            combat_log.append(f"You deal {actual_damage} damage to {enemy.enemy_type}")
+            actual_damage = enemy.take_damage(calculate_player_damage(player))
+            combat_log.append(("player_hit", actual_damage, enemy.enemy_type))
             
             # Record damage dealt for floating number
             damage_events.append({
                 'type': 'damage_dealt',
                 'amount': actual_damage,
                 'target': 'enemy',
-                'position': (enemy.q, enemy.r)
+                'position': enemy_position
             })
             
             if not enemy.alive:
                 # Enemy defeated
                 gold_gained = enemy.gold_reward
                 player.collect_gold(gold_gained)
-                combat_log.append(f"{enemy.enemy_type.title()} defeated! Gained {gold_gained} gold")
+                combat_log.append(("enemy_defeated", enemy_name, gold_gained))
                 break
             
             # Enemy attacks back
             enemy_damage = enemy.attack_player(player)
             player.take_damage(enemy_damage)
-            combat_log.append(f"{enemy.enemy_type.title()} deals {enemy_damage} damage to you")
+            combat_log.append(("enemy_hit", enemy_name, enemy_damage))
             
             # Record damage received for floating number
             damage_events.append({
                 'type': 'damage_received',
                 'amount': enemy_damage,
                 'target': 'player',
-                'position': (player.q, player.r)
+                'position': player_position
             })
             
             if player.health <= 0:
-                combat_log.append("You have been defeated!")
+                combat_log.append(("player_defeated",))
                 break
         
         return {
@@ -279,11 +318,12 @@ class CombatSystem:
 
 def create_enemy_for_floor(floor: int) -> str:
     """Create appropriate enemy type for the given floor"""
+    # Tuple literals are constants, so no choice list is built per call
     if floor == 1:
-        return random.choice(["goblin", "skeleton"])
+        return random.choice(("goblin", "skeleton"))
     elif floor <= 3:
-        return random.choice(["goblin", "skeleton", "orc"])
+        return random.choice(("goblin", "skeleton", "orc"))
     elif floor <= 5:
-        return random.choice(["orc", "skeleton", "troll"])
+        return random.choice(("orc", "skeleton", "troll"))
     else:
-        return random.choice(["orc", "troll", "troll"])  # More trolls on deeper floors
+        return random.choice(("orc", "troll", "troll"))  # More trolls on deeper floors
@@ -2,73 +2,176 @@
 Fog of War system for the dungeon crawler
 """
 
+import functools
 import pygame
-from typing import Set, Tuple, Dict
+from typing import Dict, Tuple, Iterable, List, Optional
 from .constants import *
-from .hex_grid import HexGrid
+from .hex_grid import HEX_DIRECTIONS, HEX_SCREEN_VERTEX_OFFSETS, SQRT3, HexGrid
+
+# Per-hex fog flags
+FOG_VISIBLE = 1
+FOG_EXPLORED = 2
+
+# Fog state name for each combination of flags
+FOG_STATE_NAMES = ("unknown", "preview", "explored", "visible")
+
+# render_fog overlay alpha: unexplored, explored but out of sight, visible
+FOG_ALPHA_UNKNOWN = 180
+FOG_ALPHA_EXPLORED = 100
+FOG_ALPHA_VISIBLE = 0
+
+@functools.lru_cache(maxsize=None)
+def hex_disk_offsets(radius: int) -> Tuple[Tuple[int, int], ...]:
+    """Offsets of every hex within radius steps of (0, 0), including itself"""
+    return tuple(HexGrid.get_hex_disk(0, 0, radius))
+
+@functools.lru_cache(maxsize=None)
+def hex_line_offsets(dq: int, dr: int) -> Tuple[Tuple[int, int], ...]:
+    """Hexes strictly between (0, 0) and (dq, dr) on the hex line, as offsets
+    
+    HexGrid.hex_line is translation invariant (its nudge breaks every tie the
+    same way), so each line is worked out once from the origin and reused
+    from any start tile.
+    """
+    return tuple(HexGrid.hex_line(0, 0, dq, dr)[1:-1])
+
+@functools.lru_cache(maxsize=None)
+def vision_grid_masks(radius: int, stride: int) -> Tuple[Tuple[Tuple[int, int], ...],
+                                                         Tuple[Tuple[int, int], ...]]:
+    """Line-of-sight table for a packed grid with the given row stride
+    
+    Rays share most of their hexes, so each hex that lies on any line gets a
+    bit, and (blockers, cells) is returned: blockers holds a (step, bit) pair
+    per such hex, step being its grid index relative to the viewer's; cells
+    holds a (cell, mask) pair per hex in the vision disk, mask or-ing the bits
+    of the hexes that must not be walls for it to be seen.
+    """
+    lines = [(dr * stride + dq,
+              tuple(line_r * stride + line_q for line_q, line_r in hex_line_offsets(dq, dr))
+              if (abs(dq) + abs(dr) + abs(dq + dr)) // 2 > 1 else ())
+             for dq, dr in hex_disk_offsets(radius)]
+    bits = {step: 1 << bit for bit, step in
+            enumerate(sorted({step for _, line in lines for step in line}))}
+    blockers = tuple(bits.items())
+    cells = tuple((cell, sum(bits[step] for step in set(line))) for cell, line in lines)
+    return blockers, cells
 
 class FogOfWar:
     """Manages visibility and fog of war"""
     
+    __slots__ = ('player_vision_range',
+                 '_flags', '_tile_grid', '_stride', '_offset', '_origin', '_visible_indices', '_flags_version',
+                 '_fog_surface', '_fog_stamps', '_stamp_anchor', '_world_centers', '_fog_key')
+    
     def __init__(self):
-        self.explored_tiles: Set[Tuple[int, int]] = set()
-        self.visible_tiles: Set[Tuple[int, int]] = set()
         self.player_vision_range = 3
         
-    def update_visibility(self, player_q: int, player_r: int, dungeon):
-        """Update which tiles are currently visible"""
-        self.visible_tiles.clear()
+        # FOG_* flags per hex, laid out like the dungeon's packed tile grid
+        self._flags = bytearray()
+        self._tile_grid = None  # the grid the flags were laid out for
+        self._stride = 0
+        self._offset = 0
+        self._origin = (0, 0)
         
-        # Add player position
-        self.visible_tiles.add((player_q, player_r))
-        self.explored_tiles.add((player_q, player_r))
-        
-        # Use a more comprehensive visibility algorithm
-        # Check all tiles within vision range
-        for distance in range(1, self.player_vision_range + 1):
-            for check_q in range(player_q - distance, player_q + distance + 1):
-                for check_r in range(player_r - distance, player_r + distance + 1):
-                    # Skip if outside vision range
-                    actual_distance = HexGrid.hex_distance(player_q, player_r, check_q, check_r)
-                    if actual_distance > self.player_vision_range:
-                        continue
-                    
-                    # Check line of sight
-                    if self._has_line_of_sight(player_q, player_r, check_q, check_r, dungeon):
-                        self.visible_tiles.add((check_q, check_r))
-                        self.explored_tiles.add((check_q, check_r))
+        # Grid indices whose FOG_VISIBLE flag is set
+        self._visible_indices: List[int] = []
         
-        # Add adjacent unexplored tiles for preview (to prevent blind exploration)
-        self._add_adjacent_preview_tiles(player_q, player_r)
+        # Bumped whenever the flags change
+        self._flags_version = 0
+        
+        # render_fog state: the overlay surface, hex stamps cutting holes into
+        # it, and unrounded world-space hex centers per grid index
+        self._fog_surface: Optional[pygame.Surface] = None
+        self._fog_stamps: Dict[int, pygame.Surface] = {}
+        self._stamp_anchor = (0, 0)
+        self._world_centers: Dict[int, Tuple[float, float]] = {}
+        self._fog_key: Optional[Tuple[int, int, int]] = None  # (flags version, offset) drawn
     
-    def _add_adjacent_preview_tiles(self, player_q: int, player_r: int):
-        """Add adjacent unexplored tiles to visible set for preview"""
-        neighbors = HexGrid.get_hex_neighbors(player_q, player_r)
-        for nq, nr in neighbors:
-            if (nq, nr) not in self.explored_tiles:
-                self.visible_tiles.add((nq, nr))  # Show but don't mark as explored
+    def _bind(self, dungeon):
+        """Size the flag grid to match the dungeon's tile grid"""
+        self._flags = bytearray(len(dungeon.tile_grid))
+        self._tile_grid = dungeon.tile_grid
+        self._stride = dungeon.grid_stride
+        self._offset = dungeon.grid_offset
+        self._origin = dungeon.grid_origin
+        self._visible_indices = []
+        self._world_centers = {}
+        self._flags_version += 1
     
-    def _get_tiles_at_distance(self, center_q: int, center_r: int, distance: int) -> Set[Tuple[int, int]]:
-        """Get all tiles at a specific distance from center"""
-        tiles = set()
+    def reset(self):
+        """Forget everything seen so far, e.g. for a new floor
         
-        if distance == 0:
-            return {(center_q, center_r)}
+        The overlay surface and hex stamps are kept; the flag grid is resized
+        on the next update if the dungeon changed.
+        """
+        self._flags[:] = bytes(len(self._flags))
+        self._visible_indices = []
+        self._flags_version += 1
+    
+    def _index(self, q: int, r: int) -> int:
+        """Flag grid index of a hex, or -1 if it lies outside the grid"""
+        col = q - self._origin[0]
+        index = (r - self._origin[1]) * self._stride + col
+        if 0 <= col < self._stride and 0 <= index < len(self._flags):
+            return index
+        return -1
+    
+    def update_visibility(self, player_q: int, player_r: int, dungeon):
+        """Update which tiles are currently visible"""
+        # A new or regenerated dungeon comes with a new tile grid
+        if dungeon.tile_grid is not self._tile_grid:
+            self._bind(dungeon)
+        flags = self._flags
+        stride = self._stride
+        self._flags_version += 1
         
-        # Use proper hex ring algorithm
-        # Start at one corner of the ring and walk around
-        q, r = center_q - distance, center_r
+        for index in self._visible_indices:
+            flags[index] &= ~FOG_VISIBLE
+        visible = self._visible_indices = []
         
-        # Six directions for hexagonal movement
-        directions = [(1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1)]
+        # Add player position
+        player_index = player_r * stride + player_q + self._offset
+        flags[player_index] |= FOG_VISIBLE | FOG_EXPLORED
+        visible.append(player_index)
         
-        for i, (dq, dr) in enumerate(directions):
-            for step in range(distance):
-                tiles.add((q, r))
-                q += dq
-                r += dr
+        if self.player_vision_range <= dungeon.GRID_PADDING:
+            # Hexes this close to a dungeon tile are inside the grid's wall
+            # padding, so the whole disk can be indexed relative to the player
+            # without bounds checks; the flag and tile grids share one layout
+            # Each hex between the player and the disk edge is looked up once
+            grid = dungeon.tile_grid
+            blockers, cells = vision_grid_masks(self.player_vision_range, stride)
+            blocked = 0
+            for step, bit in blockers:
+                if grid[player_index + step] == TILE_WALL:
+                    blocked |= bit
+            for cell, mask in cells:
+                if not mask & blocked:
+                    index = player_index + cell
+                    flags[index] |= FOG_VISIBLE | FOG_EXPLORED
+                    visible.append(index)
+        else:
+            # Check all tiles within vision range, walking the hex disk directly
+            for dq, dr in hex_disk_offsets(self.player_vision_range):
+                check_q = player_q + dq
+                check_r = player_r + dr
+                if self._has_line_of_sight(player_q, player_r, check_q, check_r, dungeon):
+                    index = self._index(check_q, check_r)
+                    if index >= 0:
+                        flags[index] |= FOG_VISIBLE | FOG_EXPLORED
+                        visible.append(index)
         
-        return tiles
+        # Add adjacent unexplored tiles for preview (to prevent blind exploration)
+        self._add_adjacent_preview_tiles(player_index)
+    
+    def _add_adjacent_preview_tiles(self, player_index: int):
+        """Add adjacent unexplored tiles to visible set for preview"""
+        flags = self._flags
+        for dq, dr in HEX_DIRECTIONS:
+            index = player_index + dr * self._stride + dq
+            if not flags[index] & FOG_EXPLORED:
+                flags[index] |= FOG_VISIBLE  # Show but don't mark as explored
+                self._visible_indices.append(index)
     
     def _has_line_of_sight(self, start_q: int, start_r: int, end_q: int, end_r: int, dungeon) -> bool:
         """Check if there's a clear line of sight between two points"""
@@ -77,54 +180,120 @@ class FogOfWar:
         if distance <= 1:
             return True
         
-        # Use hex line algorithm with proper interpolation
-        for i in range(1, distance):
-            # Linear interpolation parameter
-            t = i / distance
-            
-            # Interpolate in axial coordinates
-            lerp_q = start_q + (end_q - start_q) * t
-            lerp_r = start_r + (end_r - start_r) * t
-            
-            # Round to nearest hex
-            check_q, check_r = HexGrid.hex_round(lerp_q, lerp_r)
+        # Every hex on the line is within `distance` of the start tile, so while
+        # that fits in the dungeon's wall padding the packed tile grid can be
+        # indexed without a bounds check
+        use_grid = distance <= dungeon.GRID_PADDING
+        grid = dungeon.tile_grid
+        stride = dungeon.grid_stride
+        offset = dungeon.grid_offset
+        
+        # Walk the precomputed line, stopping at the first wall
+        for line_q, line_r in hex_line_offsets(end_q - start_q, end_r - start_r):
+            check_q = start_q + line_q
+            check_r = start_r + line_r
             
             # Check if this tile blocks vision (walls block vision)
-            if dungeon.get_tile(check_q, check_r) == TILE_WALL:
+            if use_grid:
+                tile_type = grid[check_r * stride + check_q + offset]
+            else:
+                tile_type = dungeon.get_tile(check_q, check_r)
+            if tile_type == TILE_WALL:
                 return False
         
         return True
     
     def is_visible(self, q: int, r: int) -> bool:
         """Check if a tile is currently visible"""
-        return (q, r) in self.visible_tiles
+        # Inlined _index: this runs per entity per frame
+        col = q - self._origin[0]
+        index = (r - self._origin[1]) * self._stride + col
+        return (0 <= col < self._stride and 0 <= index < len(self._flags) and
+                bool(self._flags[index] & FOG_VISIBLE))
     
     def is_explored(self, q: int, r: int) -> bool:
         """Check if a tile has been explored"""
-        return (q, r) in self.explored_tiles
+        index = self._index(q, r)
+        return index >= 0 and bool(self._flags[index] & FOG_EXPLORED)
+    
+    def get_states(self, positions: Iterable[Tuple[int, int]]) -> List[str]:
+        """Fog state of each position: "visible", "preview", "explored" or "unknown"
+        
+        Batched equivalent of is_visible/is_explored for whole-map passes.
+        """
+        flags = self._flags
+        stride = self._stride
+        size = len(flags)
+        origin_q, origin_r = self._origin
+        names = FOG_STATE_NAMES
+        states = []
+        for q, r in positions:
+            col = q - origin_q
+            index = (r - origin_r) * stride + col
+            states.append(names[flags[index]] if 0 <= col < stride and 0 <= index < size else "unknown")
+        return states
     
     def is_preview_only(self, q: int, r: int) -> bool:
         """Check if a tile is only visible as preview (adjacent unexplored)"""
-        return (q, r) in self.visible_tiles and (q, r) not in self.explored_tiles
+        index = self._index(q, r)
+        return index >= 0 and self._flags[index] & (FOG_VISIBLE | FOG_EXPLORED) == FOG_VISIBLE
+    
+    def _build_fog_surfaces(self):
+        """Create the overlay surface and rasterize one hex stamp per fog alpha"""
+        self._fog_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        
+        offsets = HEX_SCREEN_VERTEX_OFFSETS
+        anchor_x = -min(dx for dx, _ in offsets)
+        anchor_y = -min(dy for _, dy in offsets)
+        size = (max(dx for dx, _ in offsets) + anchor_x + 1, max(dy for _, dy in offsets) + anchor_y + 1)
+        local_vertices = [(anchor_x + dx, anchor_y + dy) for dx, dy in offsets]
+        self._stamp_anchor = (anchor_x, anchor_y)
+        
+        # Stamps are blitted with BLEND_RGBA_MIN: white outside the hex leaves the
+        # overlay untouched, the hex itself lowers the overlay to its alpha
+        for tile_flags, alpha in ((FOG_EXPLORED, FOG_ALPHA_EXPLORED),
+                                  (FOG_EXPLORED | FOG_VISIBLE, FOG_ALPHA_VISIBLE)):
+            stamp = pygame.Surface(size, pygame.SRCALPHA)
+            stamp.fill((255, 255, 255, 255))
+            pygame.draw.polygon(stamp, (0, 0, 0, alpha), local_vertices)
+            self._fog_stamps[tile_flags] = stamp
     
     def render_fog(self, screen: pygame.Surface, dungeon, offset_x: int, offset_y: int):
         """Render fog of war overlay"""
-        # Create a surface for the fog
-        fog_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        fog_surface.set_alpha(180)  # Semi-transparent
-        fog_surface.fill(BLACK)
+        if self._fog_surface is None:
+            self._build_fog_surfaces()
+        fog_surface = self._fog_surface
         
-        # Cut out holes for visible and explored areas
-        for (q, r) in self.explored_tiles:
-            x, y = HexGrid.hex_to_pixel(q, r, offset_x, offset_y)
-            vertices = HexGrid.get_hex_vertices(x, y)
-            
-            if self.is_visible(q, r):
-                # Fully visible - no fog
-                pygame.draw.polygon(fog_surface, (0, 0, 0, 0), vertices)
-            else:
-                # Explored but not visible - light fog
-                pygame.draw.polygon(fog_surface, (0, 0, 0, 100), vertices)
+        # The overlay only changes when visibility or the camera does
+        fog_key = (self._flags_version, offset_x, offset_y)
+        if fog_key != self._fog_key:
+            self._fog_key = fog_key
+            self._draw_fog(fog_surface, offset_x, offset_y)
         
         # Apply fog to screen
-        screen.blit(fog_surface, (0, 0), special_flags=pygame.BLEND_ALPHA_SDL2)
+        screen.blit(fog_surface, (0, 0))
+    
+    def _draw_fog(self, fog_surface: pygame.Surface, offset_x: int, offset_y: int):
+        """Redraw the fog overlay for the current flags and camera offset"""
+        # Semi-transparent black everywhere to start with
+        fog_surface.fill((0, 0, 0, FOG_ALPHA_UNKNOWN))
+        
+        # Cut out holes for visible and explored areas
+        origin_q, origin_r = self._origin
+        anchor_x, anchor_y = self._stamp_anchor
+        stamps = self._fog_stamps
+        world_centers = self._world_centers
+        for index, tile_flags in enumerate(self._flags):
+            if not tile_flags & FOG_EXPLORED:
+                continue
+            center = world_centers.get(index)
+            if center is None:
+                row, col = divmod(index, self._stride)
+                q = origin_q + col
+                r = origin_r + row
+                center = world_centers[index] = (HEX_RADIUS * (3/2 * q),
+                                                 HEX_RADIUS * (SQRT3/2 * q + SQRT3 * r))
+            # Fully visible hexes lose their fog, explored ones keep a light fog
+            fog_surface.blit(stamps[tile_flags],
+                             (int(center[0] + offset_x) - anchor_x, int(center[1] + offset_y) - anchor_y),
+                             special_flags=pygame.BLEND_RGBA_MIN)
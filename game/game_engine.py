@@ -9,7 +9,7 @@ from .player import Player
 from .dungeon import Dungeon
 from .enemy import CombatSystem
 from .fog_of_war import FogOfWar
-from .hex_grid import HexGrid
+from .hex_grid import HEX_SCREEN_VERTEX_OFFSETS, HexGrid
 from .ascii_renderer import ASCIIRenderer
 from .game_events import GameEventType, game_events
 from .juice_manager import juice_manager
@@ -25,6 +25,14 @@ from .juice_debug import juice_tuner, JuiceDebugOverlay
 class GameEngine:
     """Main game engine class"""
 
+    # Movement indicator outline (color, width) per (hovered, has_enemy)
+    MOVE_HIGHLIGHT_STYLES = {
+        (True, True): ((255, 100, 100), 3),
+        (True, False): ((255, 255, 255), 3),
+        (False, True): ((200, 80, 80), 2),
+        (False, False): ((150, 150, 150), 1),
+    }
+
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
         self.font = pygame.font.Font(None, 36)
@@ -73,6 +81,10 @@ class GameEngine:
 
         # Mouse interaction
         self.hovered_hex = None
+        self._hover_key = None  # (mouse hex, player hex, tile grid) hovered_hex was worked out for
+        self._neighbors_of = None  # player hex _player_neighbors was built for
+        self._player_neighbors = ()
+        self._player_neighbor_set = frozenset()
 
         # Camera/view
         self.camera_x = 0
@@ -88,6 +100,18 @@ class GameEngine:
         self.fog_of_war.update_visibility(self.player.q, self.player.r, self.dungeon)
         self.god_mode = False  # Toggle for fog of war
 
+        # Frames are only repainted when something on screen may have changed:
+        # _dirty is raised by input and by animations, _frame_key catches
+        # direct changes to the view state
+        self._dirty = True
+        self._was_animating = False
+        self._frame_key = None
+
+        # Prebaked movement indicator outlines
+        self._highlight_stamps = {}
+        self._highlight_anchor = (0, 0)
+        self._build_highlight_stamps()
+
         self._center_camera_on_player()
 
     def _center_camera_on_player(self, animate: bool = False):
@@ -97,6 +121,7 @@ class GameEngine:
 
     def handle_event(self, event: pygame.event.Event):
         """Handle input events"""
+        self._dirty = True
         if self.game_over:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
@@ -224,9 +249,7 @@ class GameEngine:
                 )
 
                 # Check if clicked hex is adjacent to player
-                neighbors = HexGrid.get_hex_neighbors(self.player.q, self.player.r)
-
-                if (target_q, target_r) in neighbors:
+                if self._is_player_neighbor(target_q, target_r):
                     # Try to move to adjacent hex
                     self._try_move_player(target_q, target_r)
                 elif (target_q, target_r) == (self.player.q, self.player.r):
@@ -241,15 +264,34 @@ class GameEngine:
                     mouse_x, mouse_y, self.camera_x, self.camera_y
                 )
 
+                # Motion within the same hex can't change the highlight
+                hover_key = (hovered_q, hovered_r, self.player.q, self.player.r, self.dungeon.tile_grid)
+                if hover_key == self._hover_key:
+                    return
+                self._hover_key = hover_key
+
                 # Only highlight if it's an adjacent walkable tile
-                neighbors = HexGrid.get_hex_neighbors(self.player.q, self.player.r)
-                if (hovered_q, hovered_r) in neighbors and self.dungeon.is_walkable(
+                if self._is_player_neighbor(hovered_q, hovered_r) and self.dungeon.is_walkable(
                     hovered_q, hovered_r
                 ):
                     self.hovered_hex = (hovered_q, hovered_r)
                 else:
                     self.hovered_hex = None
 
+    def _get_player_neighbors(self):
+        """Hexes adjacent to the player, rebuilt only when the player changes hex"""
+        player_hex = (self.player.q, self.player.r)
+        if player_hex != self._neighbors_of:
+            self._neighbors_of = player_hex
+            self._player_neighbors = tuple(HexGrid.get_hex_neighbors(*player_hex))
+            self._player_neighbor_set = frozenset(self._player_neighbors)
+        return self._player_neighbors
+
+    def _is_player_neighbor(self, q: int, r: int) -> bool:
+        """Whether (q, r) is adjacent to the player"""
+        self._get_player_neighbors()
+        return (q, r) in self._player_neighbor_set
+
     def _try_move_player(self, target_q: int, target_r: int):
         """Try to move the player to target position"""
         if self.dungeon.is_walkable(target_q, target_r):
@@ -373,7 +415,7 @@ class GameEngine:
                 
             elif combat_result["player_won"]:
                 # Remove defeated enemy
-                del self.dungeon.enemies[(enemy_q, enemy_r)]
+                self.dungeon.remove_enemy(enemy_q, enemy_r)
                 self.enemies_defeated += 1  # Track defeated enemies
                 
                 # Emit enemy death event
@@ -406,11 +448,11 @@ class GameEngine:
             self._show_floating_message_at_player(f"+{health_gained} Health!", "heal")
 
         # Generate new dungeon
-        self.dungeon = Dungeon(GRID_WIDTH, GRID_HEIGHT, self.current_floor)
+        self.dungeon.regenerate(self.current_floor)
         self.player.q, self.player.r = self.dungeon.player_start
 
         # Reset fog of war for new floor
-        self.fog_of_war = FogOfWar()
+        self.fog_of_war.reset()
         self.fog_of_war.update_visibility(self.player.q, self.player.r, self.dungeon)
 
         self._center_camera_on_player()
@@ -497,7 +539,7 @@ class GameEngine:
     def _restart_game(self):
         """Restart the game"""
         self.current_floor = 1
-        self.dungeon = Dungeon(GRID_WIDTH, GRID_HEIGHT, self.current_floor)
+        self.dungeon.regenerate(self.current_floor)
         self.player = EnhancedPlayer(*self.dungeon.player_start)
         self.game_over = False
         self.message = ""
@@ -506,12 +548,13 @@ class GameEngine:
         self.floating_messages = []  # Clear floating messages
         self.enemies_defeated = 0  # Reset enemy counter
         self.hovered_hex = None
+        self._hover_key = None
         self.camera_following = False
         self.camera_follow_timer = 0.0
         self.in_combat = False
-        self.combat_log = []
+        self.combat_log.clear()
         self.combat_log_timer = 0.0
-        self.fog_of_war = FogOfWar()
+        self.fog_of_war.reset()
         self.fog_of_war.update_visibility(self.player.q, self.player.r, self.dungeon)
         self.god_mode = False  # Reset god mode on restart
         self._center_camera_on_player()
@@ -537,6 +580,12 @@ class GameEngine:
         # Update debug overlay
         self.debug_overlay.update(juice_tuner.profiler)
         
+        # One more frame once an animation stops, to draw its resting state
+        animating = self._is_animating()
+        if animating or self._was_animating:
+            self._dirty = True
+        self._was_animating = animating
+        
         # End profiling
         juice_tuner.profiler.end_frame()
     
@@ -549,7 +598,10 @@ class GameEngine:
         particle_system.update(dt)
         
         # Update camera system
+        lighting_version = self.camera_manager.lighting_effects.version
         self.camera_manager.update(dt, self.player.q, self.player.r)
+        if self.camera_manager.lighting_effects.version != lighting_version:
+            self._dirty = True
         
         # Update camera position from camera manager
         self.camera_x, self.camera_y = self.camera_manager.get_camera_position()
@@ -565,6 +617,7 @@ class GameEngine:
             )
             # Process turn when player finishes moving (turn-based)
             self._process_turn()
+            self._dirty = True
 
         # Update camera animation
         if self.camera_following:
@@ -589,6 +642,7 @@ class GameEngine:
             self.message_timer -= dt
             if self.message_timer <= 0:
                 self.message = ""
+                self._dirty = True
         
         # Update floating messages
         for floating_msg in self.floating_messages[:]:  # Copy list to avoid modification issues
@@ -616,10 +670,30 @@ class GameEngine:
         if self.combat_log_timer > 0:
             self.combat_log_timer -= dt
             if self.combat_log_timer <= 0:
-                self.combat_log = []
+                self.combat_log.clear()
+                self._dirty = True
+
+    def _is_animating(self) -> bool:
+        """Whether anything on screen changes from one frame to the next by itself"""
+        return bool(
+            self.player.is_moving or self.player.smooth_movement.is_moving
+            or self.camera_following or self.floating_messages
+            or particle_system.get_particle_count() or particle_system.get_text_effect_count()
+            or visual_effects.hit_flash.flashes or visual_effects.screen_flash_timer > 0
+            or juice_manager.screen_shake.shake_layers
+            or juice_manager.settings.debug_overlay_enabled or self.debug_overlay.enabled
+        )
 
     def render(self):
         """Render the entire game using juice pipeline"""
+        # A still scene is already on screen from the last frame
+        frame_key = (self.camera_x, self.camera_y, self.god_mode, self.game_over,
+                     self.hovered_hex, self.dungeon.tile_grid)
+        if not self._dirty and frame_key == self._frame_key:
+            return
+        self._dirty = False
+        self._frame_key = frame_key
+
         self.juice_renderer.render_frame()
         
         # Render debug overlay on top
@@ -682,9 +756,28 @@ class GameEngine:
         if self.game_over:
             self._render_game_over_message()
 
+    def _build_highlight_stamps(self):
+        """Rasterize each movement indicator outline once onto a transparent stamp"""
+        # Leave room for the widest outline around the hex
+        offsets = HEX_SCREEN_VERTEX_OFFSETS
+        margin = max(width for _, width in self.MOVE_HIGHLIGHT_STYLES.values())
+        anchor_x = margin - min(dx for dx, _ in offsets)
+        anchor_y = margin - min(dy for _, dy in offsets)
+        size = (max(dx for dx, _ in offsets) + anchor_x + margin + 1,
+                max(dy for _, dy in offsets) + anchor_y + margin + 1)
+        local_vertices = [(anchor_x + dx, anchor_y + dy) for dx, dy in offsets]
+        self._highlight_anchor = (anchor_x, anchor_y)
+
+        for style, (color, width) in self.MOVE_HIGHLIGHT_STYLES.items():
+            stamp = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.polygon(stamp, color, local_vertices, width)
+            self._highlight_stamps[style] = stamp
+
     def _render_movement_indicators(self):
         """Render indicators for valid movement tiles"""
-        neighbors = HexGrid.get_hex_neighbors(self.player.q, self.player.r)
+        neighbors = self._get_player_neighbors()
+        anchor_x, anchor_y = self._highlight_anchor
+        blits = []
 
         for q, r in neighbors:
             # In god mode, show all walkable tiles; otherwise respect fog of war
@@ -692,21 +785,15 @@ class GameEngine:
             
             if self.dungeon.is_walkable(q, r) and is_visible:
                 x, y = HexGrid.hex_to_pixel(q, r, self.camera_x, self.camera_y)
-                vertices = HexGrid.get_hex_vertices(x, y)
-
-                # Check if there's an enemy here
-                has_enemy = self.dungeon.has_enemy(q, r)
-
-                # Different highlight for hovered vs normal adjacent tiles
-                if self.hovered_hex == (q, r):
-                    # Bright highlight for hovered tile
-                    if has_enemy:
-                        pygame.draw.polygon(self.screen, (255, 100, 100), vertices, 3)
-                    else:
-                        pygame.draw.polygon(self.screen, (255, 255, 255), vertices, 3)
-                else:
-                    # Subtle highlight for other adjacent tiles
-                    if has_enemy:
-                        pygame.draw.polygon(self.screen, (200, 80, 80), vertices, 2)
-                    else:
-                        pygame.draw.polygon(self.screen, (150, 150, 150), vertices, 1)
+
+                # Bright highlight for the hovered tile, subtle ones for other
+                # adjacent tiles, reddened when there's an enemy here
+                style = (self.hovered_hex == (q, r), self.dungeon.has_enemy(q, r))
+                blits.append((self._highlight_stamps[style], (x - anchor_x, y - anchor_y)))
+
+        if blits:
+            fblits = getattr(self.screen, "fblits", None)  # pygame-ce only
+            if fblits:
+                fblits(blits)
+            else:
+                self.screen.blits(blits, doreturn=False)
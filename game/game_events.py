@@ -2,7 +2,8 @@
 Central event bus system for game juice effects
 """
 
-from typing import Dict, List, Callable, Any
+from collections import deque
+from typing import Deque, Dict, List, Tuple, Callable, Any
 from enum import Enum
 import time
 
@@ -55,44 +56,41 @@ class EventBus:
     """Central publish/subscribe event system"""
     
     def __init__(self):
-        self.listeners: Dict[GameEventType, List[Callable]] = {}
-        self.event_history: List[GameEvent] = []
+        # Listeners are immutable tuples, rebuilt on (un)subscribe, so emit can
+        # iterate them directly even if a callback subscribes mid-dispatch
+        self.listeners: Dict[GameEventType, Tuple[Callable, ...]] = {}
         self.max_history = 100  # Keep last 100 events for debugging
+        self.event_history: Deque[GameEvent] = deque(maxlen=self.max_history)
         
     def subscribe(self, event_type: GameEventType, callback: Callable[[GameEvent], None]):
         """Subscribe to an event type"""
-        if event_type not in self.listeners:
-            self.listeners[event_type] = []
-        self.listeners[event_type].append(callback)
+        self.listeners[event_type] = self.listeners.get(event_type, ()) + (callback,)
     
     def unsubscribe(self, event_type: GameEventType, callback: Callable[[GameEvent], None]):
         """Unsubscribe from an event type"""
-        if event_type in self.listeners:
-            try:
-                self.listeners[event_type].remove(callback)
-            except ValueError:
-                pass  # Callback wasn't subscribed
+        callbacks = self.listeners.get(event_type, ())
+        if callback in callbacks:
+            index = callbacks.index(callback)
+            self.listeners[event_type] = callbacks[:index] + callbacks[index + 1:]
     
     def emit(self, event_type: GameEventType, data: Dict[str, Any] = None):
         """Emit an event to all subscribers"""
         event = GameEvent(event_type, data)
         
-        # Add to history for debugging
+        # Add to history for debugging; the deque drops the oldest event itself
         self.event_history.append(event)
-        if len(self.event_history) > self.max_history:
-            self.event_history.pop(0)
         
         # Notify all listeners
-        if event_type in self.listeners:
-            for callback in self.listeners[event_type]:
-                try:
-                    callback(event)
-                except Exception as e:
-                    print(f"Error in event callback for {event_type}: {e}")
+        for callback in self.listeners.get(event_type, ()):
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Error in event callback for {event_type}: {e}")
     
     def get_recent_events(self, count: int = 10) -> List[GameEvent]:
         """Get recent events for debugging"""
-        return self.event_history[-count:]
+        # Same slice semantics as the list history had, count <= 0 included
+        return list(self.event_history)[-count:]
     
     def clear_history(self):
         """Clear event history"""
@@ -4,7 +4,22 @@ Hexagonal grid utilities and calculations
 
 import math
 from typing import Tuple, List
-from .constants import HEX_RADIUS, HEX_HEIGHT, HEX_WIDTH
+from .constants import HEX_RADIUS, HEX_HEIGHT, HEX_WIDTH, SCREEN_WIDTH, SCREEN_HEIGHT
+
+# Axial offsets of the 6 neighbouring hexes
+HEX_DIRECTIONS = (
+    (1, 0), (1, -1), (0, -1),
+    (-1, 0), (-1, 1), (0, 1)
+)
+
+# Used by the axial <-> pixel conversions
+SQRT3 = math.sqrt(3)
+
+# Unrounded offsets of the 6 hex vertices from the hex center
+HEX_VERTEX_OFFSETS = tuple(
+    (HEX_RADIUS * math.cos(math.pi / 3 * i), HEX_RADIUS * math.sin(math.pi / 3 * i))
+    for i in range(6)
+)
 
 class HexGrid:
     """Utility class for hexagonal grid calculations"""
@@ -13,9 +28,20 @@ class HexGrid:
     def hex_to_pixel(q: int, r: int, offset_x: int = 0, offset_y: int = 0) -> Tuple[int, int]:
         """Convert hex coordinates (q, r) to pixel coordinates"""
         x = HEX_RADIUS * (3/2 * q) + offset_x
-        y = HEX_RADIUS * (math.sqrt(3)/2 * q + math.sqrt(3) * r) + offset_y
+        y = HEX_RADIUS * (SQRT3/2 * q + SQRT3 * r) + offset_y
         return int(x), int(y)
     
+    @staticmethod
+    def hex_to_world_pixel(q: int, r: int) -> Tuple[int, int]:
+        """Convert hex coordinates to pixel coordinates at camera offset (0, 0)
+        
+        Floored rather than truncated, so adding an integer camera offset gives
+        the same on-screen position as hex_to_pixel.
+        """
+        x = HEX_RADIUS * (3/2 * q)
+        y = HEX_RADIUS * (SQRT3/2 * q + SQRT3 * r)
+        return math.floor(x), math.floor(y)
+    
     @staticmethod
     def pixel_to_hex(x: int, y: int, offset_x: int = 0, offset_y: int = 0) -> Tuple[int, int]:
         """Convert pixel coordinates to hex coordinates (q, r)"""
@@ -23,7 +49,7 @@ class HexGrid:
         y -= offset_y
         
         q = (2/3 * x) / HEX_RADIUS
-        r = (-1/3 * x + math.sqrt(3)/3 * y) / HEX_RADIUS
+        r = (-1/3 * x + SQRT3/3 * y) / HEX_RADIUS
         
         return HexGrid.hex_round(q, r)
     
@@ -50,17 +76,37 @@ class HexGrid:
     @staticmethod
     def get_hex_neighbors(q: int, r: int) -> List[Tuple[int, int]]:
         """Get the 6 neighboring hex coordinates"""
-        directions = [
-            (1, 0), (1, -1), (0, -1),
-            (-1, 0), (-1, 1), (0, 1)
-        ]
-        return [(q + dq, r + dr) for dq, dr in directions]
+        return [(q + dq, r + dr) for dq, dr in HEX_DIRECTIONS]
+    
+    @staticmethod
+    def get_hex_disk(q: int, r: int, radius: int) -> List[Tuple[int, int]]:
+        """Get every hex within radius steps of (q, r), including itself"""
+        return [(q + dq, r + dr)
+                for dq in range(-radius, radius + 1)
+                for dr in range(max(-radius, -dq - radius), min(radius, -dq + radius) + 1)]
     
     @staticmethod
     def hex_distance(q1: int, r1: int, q2: int, r2: int) -> int:
         """Calculate distance between two hex coordinates"""
         return (abs(q1 - q2) + abs(q1 + r1 - q2 - r2) + abs(r1 - r2)) // 2
     
+    @staticmethod
+    def hex_line(q1: int, r1: int, q2: int, r2: int) -> List[Tuple[int, int]]:
+        """Get the hexes on the line from (q1, r1) to (q2, r2), both ends included
+        
+        Sample points are nudged off exact hex edges (as in the Red Blob Games
+        hex line) by a different amount on each cube axis, so lines along an
+        edge always break towards the same side and a translated line is the
+        same line translated.
+        """
+        distance = HexGrid.hex_distance(q1, r1, q2, r2)
+        if distance == 0:
+            return [(q1, r1)]
+        dq = q2 - q1
+        dr = r2 - r1
+        return [HexGrid.hex_round(q1 + dq * i / distance + 1e-6, r1 + dr * i / distance + 2e-6)
+                for i in range(distance + 1)]
+    
     @staticmethod
     def hex_round(q: float, r: float) -> Tuple[int, int]:
         """Round fractional hex coordinates to nearest hex"""
@@ -84,10 +130,11 @@ class HexGrid:
     @staticmethod
     def get_hex_vertices(center_x: int, center_y: int) -> List[Tuple[int, int]]:
         """Get the 6 vertices of a hexagon centered at (center_x, center_y)"""
-        vertices = []
-        for i in range(6):
-            angle = math.pi / 3 * i
-            x = center_x + HEX_RADIUS * math.cos(angle)
-            y = center_y + HEX_RADIUS * math.sin(angle)
-            vertices.append((int(x), int(y)))
-        return vertices
+        return [(int(center_x + dx), int(center_y + dy)) for dx, dy in HEX_VERTEX_OFFSETS]
+
+# Integer vertex offsets as HexGrid.get_hex_vertices produces them for an
+# on-screen center, for translating prebaked hex outlines and stamps
+HEX_SCREEN_VERTEX_OFFSETS = tuple(
+    (vx - SCREEN_WIDTH // 2, vy - SCREEN_HEIGHT // 2)
+    for vx, vy in HexGrid.get_hex_vertices(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+)
@@ -6,6 +6,7 @@ import pygame
 import time
 import json
 import os
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
 from .juice_manager import juice_manager
 from .particle_system import particle_system
@@ -180,6 +181,9 @@ class JuiceRecorder:
 class JuiceDebugOverlay:
     """Advanced debug overlay with detailed information"""
     
+    # Upper bound for the rendered text cache (FPS readouts keep changing)
+    TEXT_CACHE_SIZE = 128
+    
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
         self.font = pygame.font.Font(None, 20)
@@ -192,6 +196,22 @@ class JuiceDebugOverlay:
         self.fps_history = []
         self.particle_history = []
         self.max_history = 120  # 2 seconds at 60fps
+        
+        # (font, text, color) -> rendered surface, least recently used first
+        self._text_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+    
+    def _render_text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """Render text, reusing the surface while the same line is shown"""
+        key = (font, text, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            text_surface = font.render(text, True, color)
+            self._text_cache[key] = text_surface
+            if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return text_surface
     
     def toggle(self):
         """Toggle debug overlay"""
@@ -274,7 +294,7 @@ class JuiceDebugOverlay:
             elif "Particles:" in text and stats['effect_counts'].get('particles', 0) > 150:
                 color = (255, 255, 100)  # Yellow for high particle count
             
-            text_surface = self.font.render(text, True, color)
+            text_surface = self._render_text(self.font, text, color)
             self.screen.blit(text_surface, (15, y_offset + 5 + i * 18))
         
         return y_offset + panel_height + 10
@@ -308,7 +328,7 @@ class JuiceDebugOverlay:
             if "OFF" in text:
                 color = (150, 150, 150)
             
-            text_surface = self.small_font.render(text, True, color)
+            text_surface = self._render_text(self.small_font, text, color)
             self.screen.blit(text_surface, (15, y_offset + 5 + i * 18))
         
         return y_offset + panel_height + 10
@@ -341,7 +361,7 @@ class JuiceDebugOverlay:
         self.screen.blit(graph_surface, (x, y))
         
         # Title
-        title_surface = self.small_font.render(title, True, (255, 255, 255))
+        title_surface = self._render_text(self.small_font, title, (255, 255, 255))
         self.screen.blit(title_surface, (x + 5, y + 2))
         
         # Graph data
@@ -359,7 +379,7 @@ class JuiceDebugOverlay:
         if data:
             current_val = data[-1]
             val_text = f"{current_val:.1f}"
-            val_surface = self.small_font.render(val_text, True, color)
+            val_surface = self._render_text(self.small_font, val_text, color)
             self.screen.blit(val_surface, (x + width - 40, y + height - 18))
     
     def _render_controls_help(self):
@@ -373,7 +393,7 @@ class JuiceDebugOverlay:
         y_start = self.screen.get_height() - 60
         
         for i, text in enumerate(help_texts):
-            text_surface = self.small_font.render(text, True, (150, 150, 150))
+            text_surface = self._render_text(self.small_font, text, (150, 150, 150))
             self.screen.blit(text_surface, (10, y_start + i * 16))
 
 class JuiceTuner:
@@ -103,13 +103,13 @@ class JuiceRenderer:
         if overlay_data:
             self._draw_color_overlay(overlay_data)
     
-    def _draw_focus_flash(self, flash_data: dict):
+    def _draw_focus_flash(self, flash):
         """Draw a focus flash effect"""
-        world_x = flash_data.get('world_x', flash_data.get('x', 0))  # Backward compatibility
-        world_y = flash_data.get('world_y', flash_data.get('y', 0))
-        color = flash_data['color']
-        intensity = flash_data['intensity']
-        radius = flash_data.get('radius', 50)
+        world_x = flash.world_x
+        world_y = flash.world_y
+        color = flash.color
+        intensity = flash.intensity
+        radius = flash.radius
         
         # Apply camera offset to get screen position
         camera_x, camera_y = camera_manager.get_camera_position() if camera_manager else (0, 0)
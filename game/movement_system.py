@@ -6,6 +6,7 @@ import math
 from typing import Tuple, Optional
 from .game_events import GameEventType, game_events
 from .juice_manager import juice_manager
+from .hex_grid import HexGrid
 
 class EasingFunctions:
     """Collection of easing functions for smooth animations"""
@@ -72,9 +73,6 @@ class SmoothMovement:
         
         # Movement direction for anticipation
         self.move_direction: Optional[Tuple[float, float]] = None
-        
-        # Subscribe to movement events
-        game_events.subscribe(GameEventType.MOVE_START, self._on_move_start)
     
     def start_move(self, from_pos: Tuple[float, float], to_pos: Tuple[float, float]):
         """Start a smooth movement with anticipation"""
@@ -157,11 +155,6 @@ class SmoothMovement:
     def get_current_position(self) -> Tuple[float, float]:
         """Get current interpolated position"""
         return self.current_pos if self.current_pos else (0, 0)
-    
-    def _on_move_start(self, event):
-        """Handle move start event from game"""
-        # This will be called by the player when movement starts
-        pass
 
 class EnhancedPlayer:
     """Enhanced player with smooth movement"""
@@ -186,8 +179,6 @@ class EnhancedPlayer:
     
     def move_to(self, new_q: int, new_r: int, offset_x: int, offset_y: int):
         """Start moving to a new hex position with smooth animation"""
-        from .hex_grid import HexGrid
-        
         # Get pixel positions
         start_pixel = HexGrid.hex_to_pixel(self.q, self.r, offset_x, offset_y)
         target_pixel = HexGrid.hex_to_pixel(new_q, new_r, offset_x, offset_y)
@@ -225,7 +216,6 @@ class EnhancedPlayer:
             return int(pos[0]), int(pos[1])
         else:
             # Use standard hex-to-pixel conversion when not moving
-            from .hex_grid import HexGrid
             return HexGrid.hex_to_pixel(self.q, self.r, offset_x, offset_y)
     
     def take_damage(self, damage: int):
@@ -111,10 +111,6 @@ class MovementTrails:
     def __init__(self):
         self.trails = []  # List of trail points
         self.max_trail_length = 8
-        
-        # Subscribe to movement events
-        game_events.subscribe(GameEventType.MOVE_START, self._on_move_start)
-        game_events.subscribe(GameEventType.MOVE_END, self._on_move_end)
     
     def update(self, dt: float):
         """Update trail effects"""
@@ -144,18 +140,6 @@ class MovementTrails:
     def get_trail_points(self) -> List[Dict]:
         """Get current trail points"""
         return self.trails.copy()
-    
-    def _on_move_start(self, event):
-        """Handle movement start"""
-        from_q = event.get('from_q', 0)
-        from_r = event.get('from_r', 0)
-        # Add trail point at starting position
-        # This would need hex-to-pixel conversion
-        pass
-    
-    def _on_move_end(self, event):
-        """Handle movement end"""
-        pass
 
 class VisualEffectsManager:
     """Main manager for all visual effects"""
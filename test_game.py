@@ -19,6 +19,22 @@ try:
     from game.fog_of_war import FogOfWar
     print("✓ Fog of war imported successfully")
     
+    # Fog of war works out each line of sight once from (0, 0) and reuses it
+    # from wherever the player stands, so a moved line must keep its shape
+    from game.hex_grid import HexGrid
+    mismatches = [
+        ((q, r), (dq, dr))
+        for dq, dr in HexGrid.get_hex_disk(0, 0, 4)
+        for q in range(-10, 11)
+        for r in range(-10, 11)
+        if HexGrid.hex_line(q, r, q + dq, r + dr)
+        != [(q + lq, r + lr) for lq, lr in HexGrid.hex_line(0, 0, dq, dr)]
+    ]
+    if mismatches:
+        print(f"❌ Hex lines change when translated: start {mismatches[0][0]}, offset {mismatches[0][1]}")
+    else:
+        print("✓ Hex lines are translation invariant")
+    
     print("\n🎮 All game modules loaded successfully!")
     print("Run 'python main.py' to start the game")
     